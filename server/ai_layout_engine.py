@@ -8,7 +8,9 @@ NOW WITH INTEGRATED USAGE TRACKING!
 
 import os
 import json
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import anthropic
 
@@ -86,29 +88,42 @@ def reset_usage_stats():
 # AI LAYOUT ENGINE
 # ============================================================================
 
-async def analyze_data_for_layout(data: dict, slide_type: str) -> dict:
+# AI recommendations depend only on (slide_type, data preview), so identical
+# previews across regenerations reuse the earlier answer instead of re-calling
+# the API. Only successful AI responses are cached; defaults are cheap.
+# The cache is shared by analyze_layouts_concurrently()'s worker threads, so
+# every read and write goes through _cached_layout() under _layout_cache_lock.
+LAYOUT_CACHE_MAX = 512
+_layout_cache: Dict[tuple, dict] = {}
+_layout_cache_lock = threading.Lock()
+
+
+def _layout_cache_key(slide_type: str, data_preview: dict) -> tuple:
+    return (slide_type, json.dumps(data_preview, sort_keys=True, default=str))
+
+
+def _cached_layout(key: tuple, compute) -> Optional[dict]:
     """
-    Analyze data and return AI-powered layout recommendations.
+    Return a copy of the cached layout for key, calling compute() on a miss.
     
-    Args:
-        data: Form data dictionary
-        slide_type: Type of slide to analyze
-        
-    Returns:
-        Layout recommendation dictionary
+    compute() runs outside the lock (it is an API round-trip) and returns
+    None when there is nothing worth caching.
     """
-    # Build data preview
-    try:
-        data_preview = build_data_preview(data, slide_type)
-    except Exception as e:
-        print(f"Error building data preview for {slide_type}: {e}")
-        data_preview = {"service_count": 0, "client_count": 0, "highlight_count": 0}
-    
-    # Check if AI is available
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key or os.environ.get("DISABLE_AI_LAYOUT") == "true":
-        return get_default_layout_recommendation(slide_type, data_preview)
-    
+    with _layout_cache_lock:
+        layout = _layout_cache.get(key)
+    if layout is None:
+        layout = compute()
+        if layout is None:
+            return None
+        with _layout_cache_lock:
+            if key not in _layout_cache and len(_layout_cache) >= LAYOUT_CACHE_MAX:
+                _layout_cache.pop(next(iter(_layout_cache)), None)  # evict oldest
+            _layout_cache[key] = layout
+    return dict(layout)
+
+
+def _request_layout(api_key: str, slide_type: str, data_preview: dict, purpose: str) -> Optional[dict]:
+    """Ask the model for a layout; None when the call or its JSON fails"""
     prompt = f"""You are an expert presentation designer. Analyze this data for a "{slide_type}" slide.
 
 DATA SUMMARY:
@@ -150,7 +165,7 @@ Guidelines:
             model="claude-3-haiku-20240307",
             input_tokens=response.usage.input_tokens,
             output_tokens=response.usage.output_tokens,
-            purpose=f"AI Layout: {slide_type}"
+            purpose=purpose
         )
         
         text = response.content[0].text
@@ -161,10 +176,41 @@ Guidelines:
         if json_match:
             parsed = json.loads(json_match.group())
             print(f"AI Layout for {slide_type}: {parsed}")
-            return parsed
+            # Fill any keys the model omitted from the slide-type defaults
+            return {**get_default_layout_recommendation(slide_type, data_preview), **parsed}
             
     except Exception as e:
         print(f"AI Layout fallback for {slide_type}: {e}")
+    return None
+
+
+async def analyze_data_for_layout(data: dict, slide_type: str) -> dict:
+    """
+    Analyze data and return AI-powered layout recommendations.
+    
+    Args:
+        data: Form data dictionary
+        slide_type: Type of slide to analyze
+        
+    Returns:
+        Layout recommendation dictionary
+    """
+    # Build data preview
+    try:
+        data_preview = build_data_preview(data, slide_type)
+    except Exception as e:
+        print(f"Error building data preview for {slide_type}: {e}")
+        data_preview = {"service_count": 0, "client_count": 0, "highlight_count": 0}
+    
+    # Check if AI is available
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key or os.environ.get("DISABLE_AI_LAYOUT") == "true":
+        return get_default_layout_recommendation(slide_type, data_preview)
+    
+    layout = _cached_layout(_layout_cache_key(slide_type, data_preview),
+                            lambda: _request_layout(api_key, slide_type, data_preview, f"AI Layout: {slide_type}"))
+    if layout is not None:
+        return layout
     
     # Fallback to defaults
     return get_default_layout_recommendation(slide_type, data_preview)
@@ -189,62 +235,32 @@ def analyze_data_for_layout_sync(data: dict, slide_type: str) -> dict:
     if not api_key or os.environ.get("DISABLE_AI_LAYOUT") == "true":
         return get_default_layout_recommendation(slide_type, data_preview)
     
-    prompt = f"""You are an expert presentation designer. Analyze this data for a "{slide_type}" slide.
-
-DATA SUMMARY:
-{json.dumps(data_preview, indent=2)}
-
-Recommend the optimal design. Return ONLY valid JSON (no markdown):
-{{
-  "chart_type": "bar|pie|donut|progress|timeline|stacked-bar|none",
-  "layout": "full-width|two-column|two-column-wide-left|two-column-wide-right|grid-2x2|grid-2x3",
-  "font_adjustment": 0,
-  "content_density": "low|medium|high",
-  "primary_emphasis": "metrics|chart|text|mixed",
-  "recommendations": ["suggestion1", "suggestion2"]
-}}
+    layout = _cached_layout(_layout_cache_key(slide_type, data_preview),
+                            lambda: _request_layout(api_key, slide_type, data_preview, f"analyze_layout_{slide_type}"))
+    if layout is not None:
+        return layout
+    
+    # Fallback to defaults
+    return get_default_layout_recommendation(slide_type, data_preview)
 
-Guidelines:
-- Use pie/donut for 2-5 composition items
-- Use bar for time series/revenue growth  
-- Use progress bars for percentages/margins
-- Use timeline for milestones/roadmap
-- Use stacked-bar for revenue breakdown
-- Use two-column for balanced content
-- Use full-width for case studies or text-heavy content
-- font_adjustment: 0 for normal, -1 for dense content, -2 for very dense
-- Prioritize readability (12pt body minimum)"""
 
-    try:
-        client = anthropic.Anthropic(api_key=api_key)
-        
-        response = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=400,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        # v8.1.0: Single tracking via new usage tracker (removed legacy dual tracking)
-        tracker = get_tracker()
-        tracker.track_call(
-            model="claude-3-haiku-20240307",
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
-            purpose=f"analyze_layout_{slide_type}"
-        )
-        
-        text = response.content[0].text
-        
-        # Extract JSON from response
-        import re
-        json_match = re.search(r'\{[\s\S]*?\}', text)
-        if json_match:
-            parsed = json.loads(json_match.group())
-            print(f"AI Layout for {slide_type}: {parsed}")
-            return parsed
-            
-    except Exception as e:
-        print(f"AI Layout fallback for {slide_type}: {e}")
+def analyze_layouts_concurrently(data: dict, slide_types: List[str], max_workers: int = 4) -> Dict[str, dict]:
+    """
+    Fetch layout recommendations for several slides up front.
     
-    # Fallback to defaults
-    return get_default_layout_recommendation(slide_type, data_preview)
\ No newline at end of file
+    Each AI call is an independent network round-trip, so they run on a
+    small thread pool (bounded to stay within API rate limits) and the total
+    wait is roughly the slowest call rather than the sum. Without AI the
+    defaults are cheap and computed inline.
+    
+    Returns:
+        Dict mapping slide type to its layout recommendation
+    """
+    unique_types = list(dict.fromkeys(slide_types))
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key or os.environ.get("DISABLE_AI_LAYOUT") == "true" or len(unique_types) < 2:
+        return {st: analyze_data_for_layout_sync(data, st) for st in unique_types}
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_types))) as pool:
+        results = pool.map(lambda st: analyze_data_for_layout_sync(data, st), unique_types)
+        return dict(zip(unique_types, results))
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 
 from fastapi import FastAPI, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
@@ -202,8 +203,9 @@ async def generate_pptx(request: GenerateRequest):
                 }
             )
 
-        # v8.1.0 FIX: generate_presentation is sync, no await needed
-        prs = generate_presentation(data, theme)
+        # generate_presentation is sync and CPU-bound; build the whole deck on a
+        # worker thread so other requests keep being served meanwhile
+        prs = await run_in_threadpool(generate_presentation, data, theme)
         
         # Generate filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -213,7 +215,7 @@ async def generate_pptx(request: GenerateRequest):
         filepath = TEMP_DIR / filename
         
         # Save presentation
-        prs.save(str(filepath))
+        await run_in_threadpool(prs.save, str(filepath))
         
         print(f"Generated: {filename}")
         print(f"File size: {filepath.stat().st_size / 1024:.1f} KB")
@@ -11,7 +11,7 @@ Contains:
 - Document configurations
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, NamedTuple
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -155,9 +155,12 @@ PROFESSIONAL_TEMPLATES = [
     {"id": "sunset-warm", "name": "Sunset Warm", "category": "Bold", "primary": "EA580C", "secondary": "F59E0B", "accent": "7C3AED"}
 ]
 
+# Template lookup by id (get_theme_colors runs once per deck)
+TEMPLATES_BY_ID = {t["id"]: t for t in PROFESSIONAL_TEMPLATES}
+
 def get_theme_colors(theme_id: str) -> Dict[str, str]:
     """Get full theme colors from template ID"""
-    template = next((t for t in PROFESSIONAL_TEMPLATES if t["id"] == theme_id), PROFESSIONAL_TEMPLATES[0])
+    template = TEMPLATES_BY_ID.get(theme_id, PROFESSIONAL_TEMPLATES[0])
     
     return {
         "primary": template["primary"],
@@ -548,6 +551,41 @@ class LayoutRecommendation(BaseModel):
     content_density: str = "medium"
     primary_emphasis: str = "mixed"
 
+# ============================================================================
+# RENDER-TIME STRUCTS (lightweight, attribute access in hot render paths)
+# ============================================================================
+class LayoutRec(NamedTuple):
+    """Immutable layout recommendation handed to every slide renderer"""
+    chart_type: str = "bar"
+    layout: str = "two-column"
+    font_adjustment: int = 0
+    content_density: str = "medium"
+    primary_emphasis: str = "mixed"
+
+    @classmethod
+    def from_dict(cls, rec: dict) -> "LayoutRec":
+        """Build from an AI/default recommendation dict, ignoring unknown keys"""
+        return cls(**{k: rec[k] for k in cls._fields if rec.get(k) is not None})
+
+class ChartPoint(NamedTuple):
+    """One label/value chart entry; get() keeps the dict-style chart helpers working"""
+    label: str
+    value: float
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+class SlideContext(NamedTuple):
+    """Per-deck render context, built once in generate_presentation"""
+    doc_config: dict
+    industry_data: dict
+    buyer_types: list
+    layouts: dict  # slide type -> LayoutRec, prefetched in one batch
+    blank_layout: Any  # prs.slide_layouts[6], resolved once per deck
+    revenue: tuple  # (chart points, CAGR) from revenue_series, shared by the summary and financials slides
+    vertical: str  # primaryVertical as entered (or "technology"), for get_industry_specific_content
+    pct: dict  # filled-in percentage field -> "<value>%" label, formatted once per deck
+
 # ============================================================================
 # REQUIREMENT #10: CUSTOM QUESTION SCHEMAS
 # ============================================================================
@@ -21,29 +21,183 @@ v8.3.0 Enhancements (Deloitte-Quality Design):
 - Missing slide type handlers added (toc, company-overview, leadership, risks)
 """
 
+import copy
+import json
+import re
+import traceback
+from xml.sax.saxutils import escape as xml_escape
+from functools import lru_cache
+from itertools import cycle
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
-from pptx.enum.text import PP_ALIGN
 from pptx.enum.chart import XL_CHART_TYPE
-from pptx.chart.data import CategoryChartData
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.opc.packuri import PackURI
+from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
 from typing import Dict, List, Optional
-from models import DESIGN, INDUSTRY_DATA, DOCUMENT_CONFIGS, get_theme_colors
+from models import DESIGN, INDUSTRY_DATA, DOCUMENT_CONFIGS, ChartPoint, LayoutRec, SlideContext, get_theme_colors
 from utils import (
     truncate_text, truncate_description, format_currency, format_date,
-    parse_lines, parse_pipe_separated, calculate_cagr, safe_float, safe_int,
-    adjusted_font, extract_percentage,
-    get_slides_for_document_type, get_buyer_specific_content, get_industry_specific_content
+    parse_lines, parse_pipe_separated, parse_services_with_pct, calculate_cagr, safe_float, safe_int,
+    adjusted_font, normalize_form_keys,
+    get_slides_for_document_type, get_industry_specific_content
 )
-from ai_layout_engine import analyze_data_for_layout_sync
+from ai_layout_engine import analyze_data_for_layout_sync, analyze_layouts_concurrently
 
 # ============================================================================
-# COLOR HELPER
+# PRECOMPUTED GEOMETRY (EMU, converted once at import)
 # ============================================================================
-def hex_to_rgb(hex_color: str) -> RGBColor:
-    hex_color = hex_color.lstrip('#')
-    return RGBColor(int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
+# Shapes drawn on every slide use fixed coordinates; build their (x, y, w, h)
+# Length tuples once instead of re-running Inches() per slide.
+SLIDE_W, SLIDE_H = Inches(DESIGN["slide_width"]), Inches(DESIGN["slide_height"])
+FONTS = DESIGN["fonts"]  # same dict, one subscript shorter per lookup
+FULL_BLEED = (Inches(0), Inches(0), SLIDE_W, SLIDE_H)
+HEADER_BAR = (Inches(0), Inches(0), Inches(0.1), Inches(0.85))
+HEADER_TITLE = (Inches(0.3), Inches(0.15), Inches(9.4), Inches(0.5))
+HEADER_SUBTITLE = (Inches(0.3), Inches(0.62), Inches(9.4), Inches(0.22))
+HEADER_RULE = (Inches(0.3), Inches(0.88), Inches(9.4), Inches(0.02))
+FOOTER_RULE = (Inches(0), Inches(5.2), SLIDE_W, Inches(0.015))
+FOOTER_CONFIDENTIAL = (Inches(0.3), Inches(5.28), Inches(3), Inches(0.22))
+FOOTER_PAGE_NUM = (Inches(9.2), Inches(5.28), Inches(0.5), Inches(0.22))
+CONFIDENTIAL_TEXT = "Strictly Private & Confidential"
+PT_8, PT_9, PT_10, PT_11, PT_12 = Pt(8), Pt(9), Pt(10), Pt(11), Pt(12)
+
+# Positions computed at runtime are converted with emu(): the API and the XML
+# templates only need the integer, not a Length instance.
+EMU_PER_INCH = 914400
+
+def emu(inches: float) -> int:
+    """Same value as int(Inches(inches)) without constructing a Length"""
+    return int(inches * EMU_PER_INCH)
+
+# ============================================================================
+# CHART PART NAMING
+# ============================================================================
+# python-pptx's Package.next_partname() walks every part in the package on each
+# call, and add_chart() calls it twice (chart + embedded workbook), so charting
+# is quadratic in deck size. generate_presentation() gives each deck's package
+# its own counter: for those two templates, scan once and then hand out
+# increasing numbers. Other templates and other packages keep the stock scan.
+_COUNTED_PARTNAME_TMPLS = frozenset({ChartPart.partname_template, EmbeddedXlsxPart.partname_template})
+
+def _count_chart_partnames(package):
+    # Shadowing the method on the instance is safe: ChartPart.new() and
+    # EmbeddedXlsxPart.new() look package.next_partname up on the instance at
+    # call time, the override lives only as long as this deck's Presentation,
+    # and a deck is built on one thread, so the counter needs no lock. Nothing
+    # else adds chart or xlsx parts behind its back, so max + 1 stays free.
+    scan_next_partname, issued = package.next_partname, {}
+    def next_partname(tmpl):
+        if tmpl not in _COUNTED_PARTNAME_TMPLS:
+            return scan_next_partname(tmpl)
+        if tmpl not in issued:
+            prefix = tmpl.split("%d")[0]  # e.g. "/ppt/charts/chart"
+            issued[tmpl] = max((p.partname.idx or 0 for p in package.iter_parts() if p.partname.startswith(prefix)), default=0)
+        issued[tmpl] += 1
+        return PackURI(tmpl % issued[tmpl])
+    package.next_partname = next_partname
+
+# ============================================================================
+# XML SHAPE BUILDER
+# ============================================================================
+# Same markup python-pptx emits for add_shape() + fill.solid() + a solid or no
+# line, and for add_textbox() + one formatted run, but built from string
+# templates so static shapes skip the proxy setters.
+_SOLID_SHAPE_XML = (
+    '<p:sp %s>'
+    '<p:nvSpPr><p:cNvPr id="%%d" name="%%s %%d"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>'
+    '<a:xfrm><a:off x="%%d" y="%%d"/><a:ext cx="%%d" cy="%%d"/></a:xfrm>'
+    '<a:prstGeom prst="%%s"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="%%s"/></a:solidFill>'
+    '<a:ln>%%s</a:ln>'
+    '</p:spPr>'
+    '<p:style>'
+    '<a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef>'
+    '</p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody>'
+    '</p:sp>'
+) % nsdecls("a", "p")
+
+_TEXTBOX_XML = (
+    '<p:sp %s>'
+    '<p:nvSpPr><p:cNvPr id="%%d" name="TextBox %%d"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>'
+    '<a:xfrm><a:off x="%%d" y="%%d"/><a:ext cx="%%d" cy="%%d"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/>'
+    '</p:spPr>'
+    '<p:txBody><a:bodyPr wrap="%%s"><a:spAutoFit/></a:bodyPr><a:lstStyle/>%%s</p:txBody>'
+    '</p:sp>'
+) % nsdecls("a", "p")
+
+def _hex_val(hex_color):
+    return hex_color.lstrip('#').upper()
+
+def _solid_shape_xml(sp_id, x, y, w, h, fill_hex, prst="rect", name="Rectangle", line_hex=None):
+    ln = f'<a:solidFill><a:srgbClr val="{_hex_val(line_hex)}"/></a:solidFill>' if line_hex else '<a:noFill/>'
+    return _SOLID_SHAPE_XML % (sp_id, name, sp_id - 1, x, y, w, h, prst, _hex_val(fill_hex), ln)
+
+# Control characters XML cannot carry (\t survives; \n and \v are line breaks by now)
+_CTRL_CHARS = re.compile(r"[\x00-\x08\x0c-\x1f]")
+
+def _runs_xml(text):
+    """Runs for one paragraph; \\n and \\v become <a:br/>, other control characters _xHHHH_ and empty runs are dropped, as in python-pptx"""
+    if "\n" in text or "\v" in text:
+        return "<a:br/>".join(_runs_xml(t) for t in re.split("\n|\v", text))
+    text = _CTRL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group()), text)
+    return f'<a:r><a:t>{xml_escape(text)}</a:t></a:r>' if text else ''
+
+def _paragraph_xml(text, size=None, color_hex=None, bold=False, italic=False, align=None, space_after=None):
+    """One <a:p>; with no size the paragraph carries no pPr (inherits the frame defaults)"""
+    if size is None: return f'<a:p>{_runs_xml(text)}</a:p>'
+    algn = f' algn="{align}"' if align else ''
+    spc = f'<a:spcAft><a:spcPts val="{space_after.centipoints}"/></a:spcAft>' if space_after is not None else ''
+    style = (' b="1"' if bold else '') + (' i="1"' if italic else '')
+    return (f'<a:p><a:pPr{algn}>{spc}<a:defRPr sz="{size.centipoints}"{style}><a:solidFill>'
+            f'<a:srgbClr val="{_hex_val(color_hex)}"/></a:solidFill></a:defRPr></a:pPr>{_runs_xml(text)}</a:p>')
+
+def _text_frame_xml(sp_id, x, y, w, h, paragraphs, wrap=False):
+    """Textbox holding prebuilt <a:p> fragments; x/y/w/h in EMU"""
+    return _TEXTBOX_XML % (sp_id, sp_id - 1, x, y, w, h, "square" if wrap else "none", "".join(paragraphs))
+
+def _textbox_xml(sp_id, x, y, w, h, text, size, color_hex, bold=False, italic=False, align=None, wrap=False):
+    """align is the DrawingML value ("ctr", "r"); x/y/w/h in EMU"""
+    return _text_frame_xml(sp_id, x, y, w, h, (_paragraph_xml(text, size, color_hex, bold, italic, align),), wrap)
+
+def _frame_text_xml(sp_id, x, y, w, h, text, size, color_hex, bold=False, italic=False, align=None, wrap=False):
+    """Like _textbox_xml, but newlines start new paragraphs (styled first only), as text_frame.text = text does"""
+    first, *rest = text.split("\n")
+    paras = [_paragraph_xml(first, size, color_hex, bold, italic, align)] + [_paragraph_xml(t) for t in rest]
+    return _text_frame_xml(sp_id, x, y, w, h, paras, wrap)
+
+def add_text_xml(slide, x, y, w, h, text, size, color_hex, **style):
+    """Append a text_frame.text-style textbox (x/y/w/h in EMU, size a Pt); style as for _frame_text_xml"""
+    _append_sp_xml(slide, _frame_text_xml(slide.shapes._next_shape_id, x, y, w, h, text, size, color_hex, **style))
+
+# Wrapper so a whole batch of fragments goes through the parser in one call
+_SP_BATCH_XML = '<p:spTree %s>%%s</p:spTree>' % nsdecls("a", "p")
+
+def _append_sp_xml(slide, *fragments):
+    """Parse prebuilt <p:sp> fragments in one pass and splice them into the slide, in order, ahead of any extLst"""
+    if not fragments: return
+    sp_tree = slide.shapes._spTree
+    ext_lst = sp_tree.find(qn("p:extLst"))
+    at = len(sp_tree) if ext_lst is None else sp_tree.index(ext_lst)
+    sp_tree[at:at] = parse_xml(_SP_BATCH_XML % "".join(fragments))
+
+# ============================================================================
+# FONT SIZE HELPER
+# ============================================================================
+@lru_cache(maxsize=256)
+def font_pt(base_size: int, font_adj: int = 0) -> Pt:
+    """Pt(adjusted_font(...)), memoized: a deck only uses a few dozen sizes"""
+    return Pt(adjusted_font(base_size, font_adj))
 
 # ============================================================================
 # CHART DISPATCHER
@@ -51,145 +205,149 @@ def hex_to_rgb(hex_color: str) -> RGBColor:
 def add_chart_by_type(slide, colors, x, y, w, h, chart_type, data, font_adj=0):
     if not data or chart_type == "none":
         return None
-    dispatch = {
-        "bar": add_bar_chart, "pie": add_pie_chart, "donut": add_donut_chart,
-        "timeline": add_timeline, "progress": add_progress_bars, "stacked-bar": add_stacked_bar_chart
-    }
-    fn = dispatch.get(chart_type)
+    fn = CHART_DISPATCH.get(chart_type)
     return fn(slide, colors, x, y, w, h, data, font_adj) if fn else None
 
 # ============================================================================
 # BASE SLIDE COMPONENTS
 # ============================================================================
 def add_slide_header(slide, colors, title, subtitle=None, font_adj=0):
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(10), Inches(5.625))
-    bg.fill.solid(); bg.fill.fore_color.rgb = hex_to_rgb(colors["white"]); bg.line.fill.background()
-    bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(0.1), Inches(0.85))
-    bar.fill.solid(); bar.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); bar.line.fill.background()
-    tb = slide.shapes.add_textbox(Inches(0.3), Inches(0.15), Inches(9.4), Inches(0.5))
-    tb.text_frame.paragraphs[0].text = truncate_text(title, 80)
-    tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["title"], font_adj))
-    tb.text_frame.paragraphs[0].font.bold = True
-    tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["primary"])
+    # Accent bar, title, subtitle and rule go in as one batch of prebuilt <p:sp> XML (the white comes from the layout)
+    sp_id = slide.shapes._next_shape_id
+    frags = [
+        _solid_shape_xml(sp_id, *HEADER_BAR, colors["secondary"]),
+        _textbox_xml(sp_id + 1, *HEADER_TITLE, truncate_text(title, 80), font_pt(FONTS["title"], font_adj),
+                     colors["primary"], bold=True),
+    ]
     if subtitle:
-        sb = slide.shapes.add_textbox(Inches(0.3), Inches(0.62), Inches(9.4), Inches(0.22))
-        sb.text_frame.paragraphs[0].text = subtitle
-        sb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["subtitle"], font_adj))
-        sb.text_frame.paragraphs[0].font.italic = True
-        sb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text_light"])
-    line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.3), Inches(0.88), Inches(9.4), Inches(0.02))
-    line.fill.solid(); line.fill.fore_color.rgb = hex_to_rgb(colors["accent"]); line.line.fill.background()
+        frags.append(_textbox_xml(sp_id + 2, *HEADER_SUBTITLE, subtitle, font_pt(FONTS["subtitle"], font_adj),
+                                  colors["text_light"], italic=True))
+    frags.append(_solid_shape_xml(sp_id + len(frags), *HEADER_RULE, colors["accent"]))
+    _append_sp_xml(slide, *frags)
 
 def add_slide_footer(slide, colors, page_number):
-    line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(5.2), Inches(10), Inches(0.015))
-    line.fill.solid(); line.fill.fore_color.rgb = hex_to_rgb(colors["primary"]); line.line.fill.background()
-    cb = slide.shapes.add_textbox(Inches(0.3), Inches(5.28), Inches(3), Inches(0.22))
-    cb.text_frame.paragraphs[0].text = "Strictly Private & Confidential"
-    cb.text_frame.paragraphs[0].font.size = Pt(9); cb.text_frame.paragraphs[0].font.italic = True
-    cb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text_light"])
-    nb = slide.shapes.add_textbox(Inches(9.2), Inches(5.28), Inches(0.5), Inches(0.22))
-    nb.text_frame.paragraphs[0].text = str(page_number)
-    nb.text_frame.paragraphs[0].font.size = Pt(10); nb.text_frame.paragraphs[0].font.bold = True
-    nb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["primary"])
-    nb.text_frame.paragraphs[0].alignment = PP_ALIGN.RIGHT
+    sp_id = slide.shapes._next_shape_id
+    _append_sp_xml(slide,
+        _solid_shape_xml(sp_id, *FOOTER_RULE, colors["primary"]),
+        _textbox_xml(sp_id + 1, *FOOTER_CONFIDENTIAL, CONFIDENTIAL_TEXT, PT_9, colors["text_light"], italic=True),
+        _textbox_xml(sp_id + 2, *FOOTER_PAGE_NUM, str(page_number), PT_10, colors["primary"], bold=True, align="r"))
 
 def add_section_box(slide, colors, x, y, w, h, title=None, title_bg=None, font_adj=0):
-    box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(y), Inches(w), Inches(h))
-    box.fill.solid(); box.fill.fore_color.rgb = hex_to_rgb(colors["light_bg"])
-    box.line.color.rgb = hex_to_rgb(colors["border"])
+    # Box, header bar and title are emitted as one batch of prebuilt <p:sp> XML
+    sp_id = slide.shapes._next_shape_id
+    frags = [_solid_shape_xml(sp_id, emu(x), emu(y), emu(w), emu(h), colors["light_bg"],
+                              "roundRect", "Rounded Rectangle", line_hex=colors["border"])]
     if title:
-        hdr = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x), Inches(y), Inches(w), Inches(0.36))
-        hdr.fill.solid(); hdr.fill.fore_color.rgb = hex_to_rgb(title_bg or colors["primary"]); hdr.line.fill.background()
-        tb = slide.shapes.add_textbox(Inches(x+0.12), Inches(y+0.02), Inches(w-0.24), Inches(0.32))
-        tb.text_frame.paragraphs[0].text = truncate_text(title, 45)
-        tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["section_header"], font_adj))
-        tb.text_frame.paragraphs[0].font.bold = True
-        tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
+        frags.append(_solid_shape_xml(sp_id + 1, emu(x), emu(y), emu(w), emu(0.36), title_bg or colors["primary"]))
+        frags.append(_textbox_xml(sp_id + 2, emu(x+0.12), emu(y+0.02), emu(w-0.24), emu(0.32),
+                                  truncate_text(title, 45), font_pt(FONTS["section_header"], font_adj),
+                                  colors["white"], bold=True))
+    _append_sp_xml(slide, *frags)
 
 def add_metric_card(slide, colors, x, y, w, h, value, label, font_adj=0):
-    card = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(y), Inches(w), Inches(h))
-    card.fill.solid(); card.fill.fore_color.rgb = hex_to_rgb(colors["light_bg"])
-    card.line.color.rgb = hex_to_rgb(colors["border"])
-    vb = slide.shapes.add_textbox(Inches(x+0.08), Inches(y+0.08), Inches(w-0.16), Inches(h*0.55))
-    vb.text_frame.paragraphs[0].text = str(value)
-    vb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["metric_medium"], font_adj))
-    vb.text_frame.paragraphs[0].font.bold = True
-    vb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["primary"])
-    lb = slide.shapes.add_textbox(Inches(x+0.08), Inches(y+h*0.58), Inches(w-0.16), Inches(h*0.38))
-    lb.text_frame.paragraphs[0].text = label
-    lb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["metric_label"], font_adj))
-    lb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text_light"])
+    sp_id = slide.shapes._next_shape_id
+    _append_sp_xml(slide,
+        _solid_shape_xml(sp_id, emu(x), emu(y), emu(w), emu(h), colors["light_bg"], "roundRect", "Rounded Rectangle", line_hex=colors["border"]),
+        _textbox_xml(sp_id + 1, emu(x+0.08), emu(y+0.08), emu(w-0.16), emu(h*0.55), str(value),
+                     font_pt(FONTS["metric_medium"], font_adj), colors["primary"], bold=True),
+        _textbox_xml(sp_id + 2, emu(x+0.08), emu(y+h*0.58), emu(w-0.16), emu(h*0.38), label,
+                     font_pt(FONTS["metric_label"], font_adj), colors["text_light"]))
+
+def add_multiline_text(slide, colors, x, y, w, lines, size, pitch, color_key="text", bold=False):
+    """One textbox with a paragraph per line, `pitch` inches apart, written as a single XML fragment (size is a Pt)"""
+    if not lines: return
+    gap = Pt(max(pitch*72 - size.pt*1.2, 0))  # pitch minus single line height
+    color_hex = colors[color_key]
+    paras = [_paragraph_xml(line, size, color_hex, bold=bold, space_after=gap) for line in lines]
+    _append_sp_xml(slide, _text_frame_xml(slide.shapes._next_shape_id, emu(x), emu(y), emu(w), emu(pitch*len(lines)), paras))
+
+def add_bullet_rows(slide, colors, x, y, w, h, lines, size, pitch, color_key="text"):
+    """A textbox per line, `pitch` inches apart, appended as one batch (size is a Pt)"""
+    sp_id = slide.shapes._next_shape_id
+    _append_sp_xml(slide, *(_textbox_xml(sp_id + i, emu(x), emu(y + i*pitch), emu(w), emu(h), line, size, colors[color_key])
+                            for i, line in enumerate(lines)))
 
 # ============================================================================
 # v8.3.0: LARGE INFOGRAPHIC METRIC CARD (Deloitte-style)
 # ============================================================================
 def add_metric_card_large(slide, colors, x, y, w, h, value, label, icon_char="●", font_adj=0):
-    card = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x), Inches(y), Inches(w), Inches(h))
-    card.fill.solid(); card.fill.fore_color.rgb = hex_to_rgb(colors["light_bg"])
-    card.line.color.rgb = hex_to_rgb(colors["border"])
-    # Left accent
-    acc = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x), Inches(y), Inches(0.06), Inches(h))
-    acc.fill.solid(); acc.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); acc.line.fill.background()
-    # Icon circle
-    isz = 0.3
-    ic = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(x+0.15), Inches(y+(h-isz)/2), Inches(isz), Inches(isz))
-    ic.fill.solid(); ic.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); ic.line.fill.background()
-    itb = slide.shapes.add_textbox(Inches(x+0.15), Inches(y+(h-isz)/2), Inches(isz), Inches(isz))
-    itb.text_frame.paragraphs[0].text = icon_char
-    itb.text_frame.paragraphs[0].font.size = Pt(12)
-    itb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    itb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    # Value
-    tx = x + 0.55; tw = w - 0.65
-    vb = slide.shapes.add_textbox(Inches(tx), Inches(y+0.05), Inches(tw), Inches(h*0.55))
-    vb.text_frame.paragraphs[0].text = str(value)
-    vb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["metric"], font_adj))
-    vb.text_frame.paragraphs[0].font.bold = True
-    vb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["primary"])
-    # Label
-    lb = slide.shapes.add_textbox(Inches(tx), Inches(y+h*0.55), Inches(tw), Inches(h*0.4))
-    lb.text_frame.paragraphs[0].text = label
-    lb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["metric_label"], font_adj))
-    lb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text_light"])
+    sp_id = slide.shapes._next_shape_id
+    isz = 0.3; tx = x + 0.55; tw = w - 0.65
+    _append_sp_xml(slide,
+        _solid_shape_xml(sp_id, emu(x), emu(y), emu(w), emu(h), colors["light_bg"], line_hex=colors["border"]),
+        # Left accent
+        _solid_shape_xml(sp_id + 1, emu(x), emu(y), emu(0.06), emu(h), colors["secondary"]),
+        # Icon circle
+        _solid_shape_xml(sp_id + 2, emu(x+0.15), emu(y+(h-isz)/2), emu(isz), emu(isz), colors["secondary"], "ellipse", "Oval"),
+        _textbox_xml(sp_id + 3, emu(x+0.15), emu(y+(h-isz)/2), emu(isz), emu(isz), icon_char, PT_12, colors["white"], align="ctr"),
+        # Value
+        _textbox_xml(sp_id + 4, emu(tx), emu(y+0.05), emu(tw), emu(h*0.55), str(value),
+                     font_pt(FONTS["metric"], font_adj), colors["primary"], bold=True),
+        # Label
+        _textbox_xml(sp_id + 5, emu(tx), emu(y+h*0.55), emu(tw), emu(h*0.4), label,
+                     font_pt(FONTS["metric_label"], font_adj), colors["text_light"]))
+
+METRIC_ICONS = ("◆","▲","●","★","■","▶")
 
 def add_metric_row(slide, colors, metrics, y, x_start=0.3, total_width=9.4, font_adj=0):
     if not metrics: return
     num = min(len(metrics), 6); gap = 0.15
     cw = (total_width - (gap * (num-1))) / num; ch = 0.85
-    icons = ["◆","▲","●","★","■","▶"]
     for i in range(num):
         v, l = metrics[i][0], metrics[i][1]
-        ic = metrics[i][2] if len(metrics[i]) > 2 else icons[i % len(icons)]
+        ic = metrics[i][2] if len(metrics[i]) > 2 else METRIC_ICONS[i % len(METRIC_ICONS)]
         add_metric_card_large(slide, colors, x_start+(i*(cw+gap)), y, cw, ch, v, l, ic, font_adj)
 
 # ============================================================================
 # CHART FUNCTIONS
 # ============================================================================
+# CategoryChartData is imported inside each builder: pptx.chart.data pulls in
+# xlsxwriter (~20ms), which decks or workers that never draw a chart can skip.
+def _category_series(data):
+    """(categories, float values) of a non-empty label/value series in one pass; all-float series skip safe_float"""
+    labels, vals = zip(*[(d.get("label",""), d.get("value",0)) for d in data])
+    if all(type(v) is float for v in vals): return labels, vals
+    return labels, tuple(map(safe_float, vals))
+
+_SERIES_FILL_XML = '<c:spPr %s><a:solidFill><a:srgbClr val="%%s"/></a:solidFill></c:spPr>' % nsdecls("c", "a")
+
+def fill_series_xml(chart, hex_colors):
+    """Solid-fill each series, cycling hex_colors; same <c:spPr> as series.format.fill without the proxies"""
+    for i, ser in enumerate(chart._chartSpace.xpath(".//c:ser")):
+        ser._remove_spPr()
+        ser._insert_spPr(parse_xml(_SERIES_FILL_XML % _hex_val(hex_colors[i % len(hex_colors)])))
+
 def add_bar_chart(slide, colors, x, y, w, h, data, font_adj=0):
     if not data: return
+    from pptx.chart.data import CategoryChartData
     cd = CategoryChartData()
-    cd.categories = [d.get("label","") for d in data]
-    cd.add_series("Values", tuple(safe_float(d.get("value",0)) for d in data))
-    chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(x), Inches(y), Inches(w), Inches(h), cd).chart
+    labels, values = _category_series(data)
+    cd.categories = labels
+    cd.add_series("Values", values)
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, emu(x), emu(y), emu(w), emu(h), cd).chart
     chart.has_legend = False; chart.plots[0].has_data_labels = True
-    for s in chart.series: s.format.fill.solid(); s.format.fill.fore_color.rgb = hex_to_rgb(colors["primary"])
+    fill_series_xml(chart, (colors["primary"],))
     return chart
 
 def add_pie_chart(slide, colors, x, y, w, h, data, font_adj=0):
     if not data: return
+    from pptx.chart.data import CategoryChartData
     cd = CategoryChartData()
-    cd.categories = [d.get("label","") for d in data]
-    cd.add_series("Values", tuple(safe_float(d.get("value",0)) for d in data))
-    chart = slide.shapes.add_chart(XL_CHART_TYPE.PIE, Inches(x), Inches(y), Inches(w), Inches(h), cd).chart
+    labels, values = _category_series(data)
+    cd.categories = labels
+    cd.add_series("Values", values)
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.PIE, emu(x), emu(y), emu(w), emu(h), cd).chart
     chart.has_legend = True; chart.plots[0].has_data_labels = True
     return chart
 
 def add_donut_chart(slide, colors, x, y, w, h, data, font_adj=0):
     if not data: return
+    from pptx.chart.data import CategoryChartData
     cd = CategoryChartData()
-    cd.categories = [d.get("label","") for d in data]
-    cd.add_series("Values", tuple(safe_float(d.get("value",0)) for d in data))
-    chart = slide.shapes.add_chart(XL_CHART_TYPE.DOUGHNUT, Inches(x), Inches(y), Inches(w), Inches(h), cd).chart
+    labels, values = _category_series(data)
+    cd.categories = labels
+    cd.add_series("Values", values)
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.DOUGHNUT, emu(x), emu(y), emu(w), emu(h), cd).chart
     chart.has_legend = True; chart.plots[0].has_data_labels = True
     return chart
 
@@ -198,144 +356,151 @@ def add_timeline(slide, colors, x, y, w, h, milestones, font_adj=0):
     if not milestones: return
     num = len(milestones)
     axis_y = y + h*0.45; axis_h = 0.06
-    ab = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x), Inches(axis_y), Inches(w), Inches(axis_h))
-    ab.fill.solid(); ab.fill.fore_color.rgb = hex_to_rgb(colors["primary"]); ab.line.fill.background()
-    # Arrow head
-    ah = slide.shapes.add_shape(MSO_SHAPE.CHEVRON, Inches(x+w-0.05), Inches(axis_y-0.07), Inches(0.2), Inches(axis_h+0.14))
-    ah.fill.solid(); ah.fill.fore_color.rgb = hex_to_rgb(colors["primary"]); ah.line.fill.background()
+    sp_id = slide.shapes._next_shape_id
+    frags = [
+        _solid_shape_xml(sp_id, emu(x), emu(axis_y), emu(w), emu(axis_h), colors["primary"]),
+        # Arrow head
+        _solid_shape_xml(sp_id + 1, emu(x+w-0.05), emu(axis_y-0.07), emu(0.2), emu(axis_h+0.14), colors["primary"], "chevron", "Chevron"),
+    ]
     step = w / max(num, 1); nsz = 0.28
+    node_pt, label_pt = font_pt(8, font_adj), font_pt(9, font_adj)
+    # Only x varies per milestone; everything else alternates between two rows
+    node_y, node_sz, label_w, label_h, conn_w = emu(axis_y-(nsz-axis_h)/2), emu(nsz), emu(step - 0.1), emu(0.4), emu(0.02)
+    label_y = (emu(axis_y - 0.55), emu(axis_y + nsz + 0.05))
+    conn_y = (emu(axis_y - 0.25), emu(axis_y + nsz))
+    conn_h = (emu(0.2), emu(0.15))
     for i, ms in enumerate(milestones):
-        mx = x + (i*step) + (step/2) - (nsz/2)
+        mx = x + (i*step) + (step/2) - (nsz/2); row = i % 2
         # Node
-        c = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(mx), Inches(axis_y-(nsz-axis_h)/2), Inches(nsz), Inches(nsz))
-        c.fill.solid(); c.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); c.line.fill.background()
         yt = str(ms.get("year", ms.get("label","")))[:6]
-        ntb = slide.shapes.add_textbox(Inches(mx), Inches(axis_y-(nsz-axis_h)/2), Inches(nsz), Inches(nsz))
-        ntb.text_frame.paragraphs[0].text = yt
-        ntb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(8, font_adj))
-        ntb.text_frame.paragraphs[0].font.bold = True
-        ntb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-        ntb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        # Alternating label
+        frags.append(_solid_shape_xml(sp_id + len(frags), emu(mx), node_y, node_sz, node_sz, colors["secondary"], "ellipse", "Oval"))
+        if yt: frags.append(_textbox_xml(sp_id + len(frags), emu(mx), node_y, node_sz, node_sz, yt, node_pt, colors["white"], bold=True, align="ctr"))
+        # Connector + alternating label (empty text gets no textbox)
         lbl = truncate_text(ms.get("label", ms.get("event","")), 25)
-        lw = step - 0.1; lx = x + (i*step) + 0.05
-        ly = axis_y - 0.55 if i%2==0 else axis_y + nsz + 0.05
-        # Connector
-        cx = mx + nsz/2 - 0.01
-        cy = (axis_y - 0.25) if i%2==0 else (axis_y + nsz)
-        ch2 = 0.2 if i%2==0 else 0.15
-        cn = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(cx), Inches(cy), Inches(0.02), Inches(ch2))
-        cn.fill.solid(); cn.fill.fore_color.rgb = hex_to_rgb(colors["border"]); cn.line.fill.background()
-        tb = slide.shapes.add_textbox(Inches(lx), Inches(ly), Inches(lw), Inches(0.4))
-        tb.text_frame.text = lbl
-        tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(9, font_adj))
-        tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-        tb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        tb.text_frame.word_wrap = True
+        frags.append(_solid_shape_xml(sp_id + len(frags), emu(mx + nsz/2 - 0.01), conn_y[row], conn_w, conn_h[row], colors["border"]))
+        if lbl: frags.append(_textbox_xml(sp_id + len(frags), emu(x + (i*step) + 0.05), label_y[row], label_w, label_h, lbl, label_pt, colors["text"], align="ctr", wrap=True))
+    _append_sp_xml(slide, *frags)
 
 def add_progress_bars(slide, colors, x, y, w, h, items, font_adj=0):
     if not items: return
     num = len(items); bh = min(0.25, (h-0.1)/max(num,1)); gap = 0.1
+    sp_id = slide.shapes._next_shape_id
+    label_pt = font_pt(11, font_adj)
+    # Only the row offset and fill width vary per item
+    bar_x, bar_w, bar_h = emu(x), emu(w), emu(bh)
+    label_x, label_w, label_h = emu(x+0.1), emu(w-0.2), emu(bh-0.1)
+    frags = []
     for i, item in enumerate(items):
         by = y + (i*(bh+gap)); lbl = item.get("label",""); val = safe_float(item.get("value",0))
-        bgb = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(by), Inches(w), Inches(bh))
-        bgb.fill.solid(); bgb.fill.fore_color.rgb = hex_to_rgb(colors["light_bg"]); bgb.line.fill.background()
-        pw = max((w*val)/100, 0.3)
-        pb = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(by), Inches(pw), Inches(bh))
-        pb.fill.solid(); pb.fill.fore_color.rgb = hex_to_rgb(colors["primary"]); pb.line.fill.background()
-        tb = slide.shapes.add_textbox(Inches(x+0.1), Inches(by+0.05), Inches(w-0.2), Inches(bh-0.1))
-        tb.text_frame.text = f"{lbl}: {val}%"
-        tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(11, font_adj))
-        tb.text_frame.paragraphs[0].font.bold = True
-        tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
+        frags.append(_solid_shape_xml(sp_id + len(frags), bar_x, emu(by), bar_w, bar_h, colors["light_bg"], "roundRect", "Rounded Rectangle"))
+        if val > 0:  # no stub fill for empty bars
+            pw = max((w*val)/100, 0.3)
+            frags.append(_solid_shape_xml(sp_id + len(frags), bar_x, emu(by), emu(pw), bar_h, colors["primary"], "roundRect", "Rounded Rectangle"))
+        frags.append(_textbox_xml(sp_id + len(frags), label_x, emu(by+0.05), label_w, label_h, f"{lbl}: {val}%", label_pt, colors["white"], bold=True))
+    _append_sp_xml(slide, *frags)
 
 # v8.3.0: PROPER STACKED BAR
 def add_stacked_bar_chart(slide, colors, x, y, w, h, data, font_adj=0):
     if not data: return
+    from pptx.chart.data import CategoryChartData
+    # Transpose the rows into category/series columns in a single pass
+    labels, services, resale = [], [], []; has2 = False
+    for d in data:
+        v2 = d.get("value2")
+        labels.append(d.get("label","")); services.append(safe_float(d.get("value",0))); resale.append(safe_float(v2 or 0))
+        has2 = has2 or bool(v2)
     cd = CategoryChartData()
-    cd.categories = [d.get("label","") for d in data]
-    cd.add_series("Services", tuple(safe_float(d.get("value",0)) for d in data))
-    has2 = any(d.get("value2") for d in data)
-    if has2: cd.add_series("License/Resale", tuple(safe_float(d.get("value2",0)) for d in data))
+    cd.categories = labels
+    cd.add_series("Services", tuple(services))
+    if has2: cd.add_series("License/Resale", tuple(resale))
     ct = XL_CHART_TYPE.COLUMN_STACKED if has2 else XL_CHART_TYPE.COLUMN_CLUSTERED
-    chart = slide.shapes.add_chart(ct, Inches(x), Inches(y), Inches(w), Inches(h), cd).chart
+    chart = slide.shapes.add_chart(ct, emu(x), emu(y), emu(w), emu(h), cd).chart
     chart.has_legend = has2; chart.plots[0].has_data_labels = True
-    cc = colors.get("chart_colors", [colors["primary"], colors["secondary"]])
-    for i, s in enumerate(chart.series):
-        s.format.fill.solid(); s.format.fill.fore_color.rgb = hex_to_rgb(cc[i % len(cc)])
+    fill_series_xml(chart, colors.get("chart_colors") or (colors["primary"], colors["secondary"]))
     return chart
 
+# Built once, after the chart helpers exist; add_chart_by_type looks types up here
+CHART_DISPATCH = {
+    "bar": add_bar_chart, "pie": add_pie_chart, "donut": add_donut_chart,
+    "timeline": add_timeline, "progress": add_progress_bars, "stacked-bar": add_stacked_bar_chart
+}
+
 def add_cagr_annotation(slide, colors, x, y, w, cagr_value, font_adj=0):
     if not cagr_value: return
-    al = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x+0.2), Inches(y), Inches(w-0.4), Inches(0.03))
-    al.fill.solid(); al.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); al.line.fill.background()
-    for ax in [x+0.15, x+w-0.25]:
-        d = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(ax), Inches(y-0.04), Inches(0.1), Inches(0.1))
-        d.fill.solid(); d.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); d.line.fill.background()
-    ct = slide.shapes.add_textbox(Inches(x+w*0.25), Inches(y-0.22), Inches(w*0.5), Inches(0.2))
-    ct.text_frame.paragraphs[0].text = f"CAGR: {cagr_value}%"
-    ct.text_frame.paragraphs[0].font.size = Pt(adjusted_font(9, font_adj))
-    ct.text_frame.paragraphs[0].font.bold = True
-    ct.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["secondary"])
-    ct.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    sp_id = slide.shapes._next_shape_id; sec = colors["secondary"]
+    _append_sp_xml(slide,
+        _solid_shape_xml(sp_id, emu(x+0.2), emu(y), emu(w-0.4), emu(0.03), sec),
+        _solid_shape_xml(sp_id + 1, emu(x+0.15), emu(y-0.04), emu(0.1), emu(0.1), sec, "ellipse", "Oval"),
+        _solid_shape_xml(sp_id + 2, emu(x+w-0.25), emu(y-0.04), emu(0.1), emu(0.1), sec, "ellipse", "Oval"),
+        _textbox_xml(sp_id + 3, emu(x+w*0.25), emu(y-0.22), emu(w*0.5), emu(0.2), f"CAGR: {cagr_value}%",
+                     font_pt(9, font_adj), sec, bold=True, align="ctr"))
 
 # ============================================================================
 # v8.3.0: SECTION DIVIDER (Deloitte dark full-bleed)
 # ============================================================================
 def render_section_divider(slide, colors, section_title, section_number=None, font_adj=0):
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(10), Inches(5.625))
-    bg.fill.solid(); bg.fill.fore_color.rgb = hex_to_rgb(colors["primary"]); bg.line.fill.background()
-    al = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(1), Inches(2.2), Inches(8), Inches(0.04))
-    al.fill.solid(); al.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); al.line.fill.background()
+    white = colors["white"]
+    sp_id = slide.shapes._next_shape_id
+    frags = [_solid_shape_xml(sp_id, *FULL_BLEED, colors["primary"]),
+             _solid_shape_xml(sp_id + 1, emu(1), emu(2.2), emu(8), emu(0.04), colors["secondary"])]
     if section_number is not None:
-        bsz = 0.6
-        b = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(1), Inches(1.3), Inches(bsz), Inches(bsz))
-        b.fill.solid(); b.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); b.line.fill.background()
-        btb = slide.shapes.add_textbox(Inches(1), Inches(1.3), Inches(bsz), Inches(bsz))
-        btb.text_frame.paragraphs[0].text = str(section_number)
-        btb.text_frame.paragraphs[0].font.size = Pt(22); btb.text_frame.paragraphs[0].font.bold = True
-        btb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-        btb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    ttb = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(1.0))
-    ttb.text_frame.paragraphs[0].text = section_title
-    ttb.text_frame.paragraphs[0].font.size = Pt(40); ttb.text_frame.paragraphs[0].font.bold = True
-    ttb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    stb = slide.shapes.add_textbox(Inches(1), Inches(3.5), Inches(8), Inches(0.4))
-    stb.text_frame.paragraphs[0].text = "Strictly Private & Confidential"
-    stb.text_frame.paragraphs[0].font.size = Pt(12); stb.text_frame.paragraphs[0].font.italic = True
-    stb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
+        bsz = emu(0.6)
+        frags += [_solid_shape_xml(sp_id + 2, emu(1), emu(1.3), bsz, bsz, colors["secondary"], "ellipse", "Oval"),
+                  _textbox_xml(sp_id + 3, emu(1), emu(1.3), bsz, bsz, str(section_number), Pt(22), white, bold=True,
+                               align="ctr")]
+    sp_id += len(frags)
+    _append_sp_xml(slide, *frags,
+        _textbox_xml(sp_id, emu(1), emu(2.5), emu(8), emu(1.0), section_title, Pt(40), white, bold=True),
+        _textbox_xml(sp_id + 1, emu(1), emu(3.5), emu(8), emu(0.4), CONFIDENTIAL_TEXT, PT_12, white, italic=True))
 
 
 # ============================================================================
 # RENDER FUNCTIONS
 # ============================================================================
+# Revenue fields (already camelCase after normalize_form_keys) and chart labels
+REVENUE_KEYS = (("revenueFY24", "FY24"), ("revenueFY25", "FY25"), ("revenueFY26P", "FY26P"), ("revenueFY27P", "FY27P"))
+# Slide type -> table of contents entry, in deck order
+TOC_LABELS = {"executive-summary":"Executive Summary","investment-highlights":"Investment Highlights",
+    "company-overview":"Company Overview","services":"Service Lines & Capabilities",
+    "clients":"Client Portfolio","financials":"Financial Performance",
+    "case-study":"Case Studies","growth":"Growth Strategy & Roadmap",
+    "market-position":"Market Position","synergies":"Strategic Value & Synergies",
+    "risks":"Risk Factors & Mitigation","leadership":"Leadership Team"}
+TOC_DEFAULT_ENTRIES = tuple(TOC_LABELS.values())
+TOC_COL_X = (0.5, 5.3)
+# Case study field -> sidebar label
+CASE_STUDY_META_KEYS = (("industry","Industry"),("customerSince","Customer Since"),("engagementType","Engagement"),
+                        ("platform","Platform"),("pricingModel","Pricing Model"))
+
+# Percentage fields shown on metric cards, possibly on more than one slide
+PCT_FIELDS = ("top10Concentration", "netRetention", "ebitdaMarginFY25", "grossMargin", "netProfitMargin", "marketGrowthRate")
+
+def percent_labels(data):
+    """'<value>%' card text for each filled-in PCT_FIELDS entry"""
+    return {key: f"{v}%" for key in PCT_FIELDS if (v := data.get(key))}
+
+def revenue_series(data):
+    """Chart points for the revenue fields that are filled in, and their CAGR (None with fewer than two)"""
+    revenue_data = [ChartPoint(label, val) for key, label in REVENUE_KEYS if (val := safe_float(data.get(key)))]
+    if len(revenue_data) < 2: return revenue_data, None
+    return revenue_data, calculate_cagr(revenue_data[0].value, revenue_data[-1].value, len(revenue_data)-1)
+
 def render_executive_summary(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
-    chart_type = layout_rec.get("chart_type", "bar")
-    layout = layout_rec.get("layout", "two-column")
-    buyer_types = data.get("targetBuyerType") or data.get("target_buyer_type") or ["strategic"]
-    vertical = data.get("primaryVertical") or data.get("primary_vertical") or "technology"
-    buyer_content = get_buyer_specific_content(buyer_types, "executive-summary", data)
-    industry_content = get_industry_specific_content(vertical, "executive-summary")
+    font_adj = layout_rec.font_adjustment
+    chart_type = layout_rec.chart_type
+    layout = layout_rec.layout
+    industry_content = get_industry_specific_content(context.vertical, "executive-summary")
     add_slide_header(slide, colors, "Executive Summary", industry_content.get("context"), font_adj)
     add_slide_footer(slide, colors, page_num)
     if layout == "two-column":
         add_section_box(slide, colors, 0.3, 0.95, 4.5, 2.8, "Company Overview", font_adj=font_adj)
-        desc = data.get("companyDescription") or data.get("company_description") or ""
-        tb = slide.shapes.add_textbox(Inches(0.45), Inches(1.45), Inches(4.2), Inches(2.0))
-        tb.text_frame.text = truncate_description(desc, 300)
-        tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body"], font_adj))
-        tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-        tb.text_frame.word_wrap = True
+        desc = data.get("companyDescription") or ""
+        add_text_xml(slide, emu(0.45), emu(1.45), emu(4.2), emu(2.0), truncate_description(desc, 300),
+                     font_pt(FONTS["body"], font_adj), colors["text"], wrap=True)
         add_section_box(slide, colors, 5.0, 0.95, 4.7, 2.8, "Revenue Growth", colors["secondary"], font_adj)
-        revenue_data = []
-        for key, label in [("revenueFY24","FY24"),("revenueFY25","FY25"),("revenueFY26P","FY26P"),("revenueFY27P","FY27P")]:
-            val = safe_float(data.get(key))
-            if val: revenue_data.append({"label": label, "value": val})
+        revenue_data, cagr = context.revenue
         if revenue_data and chart_type != "none":
-            if len(revenue_data) >= 2:
-                cagr = calculate_cagr(revenue_data[0]["value"], revenue_data[-1]["value"], len(revenue_data)-1)
-                if cagr: add_cagr_annotation(slide, colors, 5.2, 1.35, 4.3, round(cagr,1), font_adj)
+            if cagr: add_cagr_annotation(slide, colors, 5.2, 1.35, 4.3, round(cagr,1), font_adj)
             add_chart_by_type(slide, colors, 5.2, 1.5, 4.3, 2.0, chart_type, revenue_data, font_adj)
         # Bottom metric row
         metrics = []
@@ -344,134 +509,107 @@ def render_executive_summary(slide, colors, data, page_num, layout_rec, context)
         t10 = data.get("top10Concentration") or data.get("topClientCount") or ""
         if t10: metrics.append((f"{t10}%", "Top 10 Conc.", "●"))
         else: metrics.append((str(data.get("headquarters") or "N/A")[:15], "Headquarters", "●"))
-        ebitda = data.get("ebitdaMarginFY25") or data.get("ebitda_margin_fy25") or ""
-        if ebitda: metrics.append((f"{ebitda}%", "EBITDA Margin", "★"))
+        if ebitda := context.pct.get("ebitdaMarginFY25"): metrics.append((ebitda, "EBITDA Margin", "★"))
         add_metric_row(slide, colors, metrics, y=4.0, font_adj=font_adj)
     elif layout == "full-width":
         add_section_box(slide, colors, 0.3, 0.95, 9.4, 3.8, "Executive Summary", font_adj=font_adj)
         desc = data.get("companyDescription") or ""
-        tb = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9.0), Inches(2.8))
-        tb.text_frame.text = truncate_description(desc, 600)
-        tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_large"], font_adj))
-        tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
+        add_text_xml(slide, emu(0.5), emu(1.5), emu(9.0), emu(2.8), truncate_description(desc, 600),
+                     font_pt(FONTS["body_large"], font_adj), colors["text"])
 
 def render_services(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
-    chart_type = layout_rec.get("chart_type", "donut")
+    font_adj = layout_rec.font_adjustment
+    chart_type = layout_rec.chart_type
     add_slide_header(slide, colors, "Service Lines & Capabilities", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
-    service_text = data.get("serviceLines") or data.get("service_lines") or ""
-    services = parse_pipe_separated(service_text, 8)
+    service_text = data.get("serviceLines") or ""
+    services, chart_data = parse_services_with_pct(service_text, 8)
     add_section_box(slide, colors, 0.3, 0.95, 4.8, 3.8, "Service Offerings", font_adj=font_adj)
     ind_colors = [colors["primary"], colors["secondary"], colors["accent"], colors.get("success","38A169")]
     y_pos = 1.5
+    name_pt, desc_pt = font_pt(FONTS["body"], font_adj), font_pt(FONTS["body_small"], font_adj)
+    # Only the row offset varies per service
+    dot_x, dot_sz, text_x, text_w, text_h = emu(0.5), emu(0.12), emu(0.72), emu(4.2), emu(0.25)
+    sp_id = slide.shapes._next_shape_id
+    frags = []
     for idx, svc in enumerate(services[:6]):
         if len(svc) >= 2:
             name = truncate_text(svc[0], 30); pct = svc[1] if len(svc)>1 else ""
             desc = svc[2] if len(svc)>2 else ""
             ic = ind_colors[idx % len(ind_colors)]
-            ind = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.5), Inches(y_pos+0.02), Inches(0.12), Inches(0.12))
-            ind.fill.solid(); ind.fill.fore_color.rgb = hex_to_rgb(ic); ind.line.fill.background()
-            tb = slide.shapes.add_textbox(Inches(0.72), Inches(y_pos-0.02), Inches(4.2), Inches(0.25))
-            tb.text_frame.text = f"{name} ({pct})"
-            tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body"], font_adj))
-            tb.text_frame.paragraphs[0].font.bold = True
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
+            frags += [
+                _solid_shape_xml(sp_id + len(frags), dot_x, emu(y_pos+0.02), dot_sz, dot_sz, ic),
+                _frame_text_xml(sp_id + len(frags) + 1, text_x, emu(y_pos-0.02), text_w, text_h, f"{name} ({pct})",
+                                name_pt, colors["text"], bold=True),
+            ]
             if desc:
-                dtb = slide.shapes.add_textbox(Inches(0.72), Inches(y_pos+0.2), Inches(4.2), Inches(0.25))
-                dtb.text_frame.text = truncate_text(desc, 50)
-                dtb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_small"], font_adj))
-                dtb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text_light"])
+                frags.append(_frame_text_xml(sp_id + len(frags), text_x, emu(y_pos+0.2), text_w, text_h,
+                                             truncate_text(desc, 50), desc_pt, colors["text_light"]))
                 y_pos += 0.55
             else: y_pos += 0.4
+    _append_sp_xml(slide, *frags)
     add_section_box(slide, colors, 5.3, 0.95, 4.4, 3.8, "Revenue by Service", colors["secondary"], font_adj)
-    chart_data = []
-    for svc in services:
-        if len(svc) >= 2:
-            n = truncate_text(svc[0],20); p = safe_float(svc[1].replace("%","").strip())
-            if p > 0: chart_data.append({"label": n, "value": p})
     if chart_data and chart_type != "none":
         add_chart_by_type(slide, colors, 5.5, 1.5, 4.0, 2.8, chart_type, chart_data, font_adj)
 
 def render_clients(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
+    font_adj = layout_rec.font_adjustment
     add_slide_header(slide, colors, "Client Portfolio", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
-    client_text = data.get("topClients") or data.get("top_clients") or ""
+    client_text = data.get("topClients") or ""
     clients = parse_pipe_separated(client_text, 12)
     add_section_box(slide, colors, 0.3, 0.95, 3.2, 3.8, "Key Metrics", font_adj=font_adj)
-    top10 = data.get("top10Concentration") or data.get("top_10_concentration") or "N/A"
-    nrr = data.get("netRetention") or data.get("net_retention") or "N/A"
-    add_metric_card(slide, colors, 0.45, 1.5, 2.9, 0.75, f"{top10}%", "Top 10 Concentration", font_adj)
-    add_metric_card(slide, colors, 0.45, 2.5, 2.9, 0.75, f"{nrr}%", "Net Revenue Retention", font_adj)
+    pct = context.pct
+    add_metric_card(slide, colors, 0.45, 1.5, 2.9, 0.75, pct.get("top10Concentration", "N/A%"), "Top 10 Concentration", font_adj)
+    add_metric_card(slide, colors, 0.45, 2.5, 2.9, 0.75, pct.get("netRetention", "N/A%"), "Net Revenue Retention", font_adj)
     add_section_box(slide, colors, 3.7, 0.95, 6.0, 3.8, "Top Clients", colors["secondary"], font_adj)
-    y_pos = 1.5
-    for cl in clients[:10]:
-        if cl:
-            n = truncate_text(cl[0] if len(cl)>0 else "", 40)
-            tb = slide.shapes.add_textbox(Inches(3.9), Inches(y_pos), Inches(5.6), Inches(0.3))
-            tb.text_frame.text = f"• {n}"
-            tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_small"], font_adj))
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            y_pos += 0.32
+    add_bullet_rows(slide, colors, 3.9, 1.5, 5.6, 0.3, [f"• {truncate_text(cl[0], 40)}" for cl in clients[:10] if cl],
+                    font_pt(FONTS["body_small"], font_adj), 0.32)
 
 def render_financials(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
-    chart_type = layout_rec.get("chart_type", "bar")
+    font_adj = layout_rec.font_adjustment
+    chart_type = layout_rec.chart_type
     add_slide_header(slide, colors, "Financial Performance", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     add_section_box(slide, colors, 0.3, 0.95, 4.5, 3.8, "Revenue Trend (INR Cr)", font_adj=font_adj)
-    revenue_data = []
-    for key, label in [("revenueFY24","FY24"),("revenueFY25","FY25"),("revenueFY26P","FY26P"),("revenueFY27P","FY27P")]:
-        val = safe_float(data.get(key))
-        if val: revenue_data.append({"label": label, "value": val})
+    revenue_data, cagr = context.revenue
     if revenue_data and chart_type != "none":
-        if len(revenue_data) >= 2:
-            cagr = calculate_cagr(revenue_data[0]["value"], revenue_data[-1]["value"], len(revenue_data)-1)
-            if cagr: add_cagr_annotation(slide, colors, 0.5, 1.35, 4.1, round(cagr,1), font_adj)
+        if cagr: add_cagr_annotation(slide, colors, 0.5, 1.35, 4.1, round(cagr,1), font_adj)
         add_chart_by_type(slide, colors, 0.5, 1.5, 4.1, 2.8, chart_type, revenue_data, font_adj)
     add_section_box(slide, colors, 5.0, 0.95, 4.7, 3.8, "Profitability Metrics", colors["secondary"], font_adj)
-    ebitda = data.get("ebitdaMarginFY25") or data.get("ebitda_margin_fy25") or "N/A"
-    gross = data.get("grossMargin") or data.get("gross_margin") or "N/A"
-    net = data.get("netProfitMargin") or data.get("net_profit_margin") or "N/A"
-    add_metric_card(slide, colors, 5.2, 1.5, 4.3, 0.65, f"{ebitda}%", "EBITDA Margin FY25", font_adj)
-    add_metric_card(slide, colors, 5.2, 2.35, 4.3, 0.65, f"{gross}%", "Gross Margin", font_adj)
-    add_metric_card(slide, colors, 5.2, 3.2, 4.3, 0.65, f"{net}%", "Net Profit Margin", font_adj)
+    pct = context.pct
+    add_metric_card(slide, colors, 5.2, 1.5, 4.3, 0.65, pct.get("ebitdaMarginFY25", "N/A%"), "EBITDA Margin FY25", font_adj)
+    add_metric_card(slide, colors, 5.2, 2.35, 4.3, 0.65, pct.get("grossMargin", "N/A%"), "Gross Margin", font_adj)
+    add_metric_card(slide, colors, 5.2, 3.2, 4.3, 0.65, pct.get("netProfitMargin", "N/A%"), "Net Profit Margin", font_adj)
 
 # v8.3.0: ENHANCED CASE STUDY (Deloitte sidebar + sections)
 def render_case_study(slide, colors, data, page_num, case_study, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
+    font_adj = layout_rec.font_adjustment
     client = case_study.get("client", "Client")
     add_slide_header(slide, colors, f"Case Study: {truncate_text(client, 50)}", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     # LEFT SIDEBAR
     sx, sy, sw, sh = 0.3, 0.95, 2.8, 4.0
-    sb = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(sx), Inches(sy), Inches(sw), Inches(sh))
-    sb.fill.solid(); sb.fill.fore_color.rgb = hex_to_rgb(colors["light_bg"]); sb.line.color.rgb = hex_to_rgb(colors["border"])
-    shdr = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(sx), Inches(sy), Inches(sw), Inches(0.36))
-    shdr.fill.solid(); shdr.fill.fore_color.rgb = hex_to_rgb(colors["primary"]); shdr.line.fill.background()
-    htb = slide.shapes.add_textbox(Inches(sx+0.12), Inches(sy+0.02), Inches(sw-0.24), Inches(0.32))
-    htb.text_frame.paragraphs[0].text = truncate_text(client, 25)
-    htb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(12, font_adj))
-    htb.text_frame.paragraphs[0].font.bold = True
-    htb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
+    sp_id = slide.shapes._next_shape_id
+    frags = [
+        _solid_shape_xml(sp_id, emu(sx), emu(sy), emu(sw), emu(sh), colors["light_bg"], line_hex=colors["border"]),
+        _solid_shape_xml(sp_id + 1, emu(sx), emu(sy), emu(sw), emu(0.36), colors["primary"]),
+        _textbox_xml(sp_id + 2, emu(sx+0.12), emu(sy+0.02), emu(sw-0.24), emu(0.32), truncate_text(client, 25),
+                     font_pt(12, font_adj), colors["white"], bold=True),
+    ]
     # Metadata
     my = sy + 0.5
-    meta = []
-    for k, lbl in [("industry","Industry"),("customerSince","Customer Since"),("engagementType","Engagement"),("platform","Platform"),("pricingModel","Pricing Model")]:
-        v = case_study.get(k, "")
-        if v: meta.append((lbl, v))
+    meta = [(lbl, v) for k, lbl in CASE_STUDY_META_KEYS if (v := case_study.get(k, ""))]
     if not meta: meta = [("Type","Enterprise"),("Engagement","Multi-year")]
+    meta_x, meta_w = emu(sx+0.15), emu(sw-0.3)
     for ml, mv in meta:
-        mlb = slide.shapes.add_textbox(Inches(sx+0.15), Inches(my), Inches(sw-0.3), Inches(0.18))
-        mlb.text_frame.paragraphs[0].text = ml
-        mlb.text_frame.paragraphs[0].font.size = Pt(8); mlb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text_light"])
-        mvb = slide.shapes.add_textbox(Inches(sx+0.15), Inches(my+0.15), Inches(sw-0.3), Inches(0.2))
-        mvb.text_frame.paragraphs[0].text = truncate_text(str(mv), 25)
-        mvb.text_frame.paragraphs[0].font.size = Pt(10); mvb.text_frame.paragraphs[0].font.bold = True
-        mvb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
+        frags += [
+            _textbox_xml(sp_id + len(frags), meta_x, emu(my), meta_w, emu(0.18), ml, PT_8, colors["text_light"]),
+            _textbox_xml(sp_id + len(frags) + 1, meta_x, emu(my+0.15), meta_w, emu(0.2), truncate_text(str(mv), 25),
+                         PT_10, colors["text"], bold=True),
+        ]
         my += 0.4
-    # RIGHT: Challenge/Solution/Results
+    # RIGHT: Challenge/Solution/Results, appended in the same batch as the sidebar
     rx = sx + sw + 0.2; rw = 9.4 - sw - 0.2
     sections = [
         ("Challenge", case_study.get("challenge",""), colors["accent"]),
@@ -479,285 +617,252 @@ def render_case_study(slide, colors, data, page_num, case_study, layout_rec, con
         ("Results", case_study.get("results",""), colors["secondary"])
     ]
     sec_y = sy; sec_h = sh / 3 - 0.05
+    title_size, body_size = font_pt(11, font_adj), font_pt(FONTS["body_small"], font_adj)
+    # Only the section offset varies
+    bar_x, bar_w, bar_h, text_x, text_w = emu(rx), emu(rw), emu(0.3), emu(rx+0.1), emu(rw-0.2)
+    panel_h, body_h = emu(sec_h-0.3), emu(sec_h-0.4)
+    sp_id += len(frags)
     for title, content, hc in sections:
-        sh2 = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(rx), Inches(sec_y), Inches(rw), Inches(0.3))
-        sh2.fill.solid(); sh2.fill.fore_color.rgb = hex_to_rgb(hc); sh2.line.fill.background()
-        stb = slide.shapes.add_textbox(Inches(rx+0.1), Inches(sec_y+0.01), Inches(rw-0.2), Inches(0.28))
-        stb.text_frame.paragraphs[0].text = title
-        stb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(11, font_adj))
-        stb.text_frame.paragraphs[0].font.bold = True
-        stb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-        cbg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(rx), Inches(sec_y+0.3), Inches(rw), Inches(sec_h-0.3))
-        cbg.fill.solid(); cbg.fill.fore_color.rgb = hex_to_rgb(colors["light_bg"])
-        cbg.line.color.rgb = hex_to_rgb(colors["border"])
-        ctb = slide.shapes.add_textbox(Inches(rx+0.1), Inches(sec_y+0.35), Inches(rw-0.2), Inches(sec_h-0.4))
-        ctb.text_frame.text = truncate_description(content, 180)
-        ctb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_small"], font_adj))
-        ctb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-        ctb.text_frame.word_wrap = True
+        frags += [
+            _solid_shape_xml(sp_id, bar_x, emu(sec_y), bar_w, bar_h, hc),
+            _textbox_xml(sp_id + 1, text_x, emu(sec_y+0.01), text_w, emu(0.28), title, title_size,
+                         colors["white"], bold=True),
+            _solid_shape_xml(sp_id + 2, bar_x, emu(sec_y+0.3), bar_w, panel_h, colors["light_bg"],
+                             line_hex=colors["border"]),
+            _frame_text_xml(sp_id + 3, text_x, emu(sec_y+0.35), text_w, body_h,
+                            truncate_description(content, 180), body_size, colors["text"], wrap=True),
+        ]
+        sp_id += 4
         sec_y += sec_h + 0.05
+    _append_sp_xml(slide, *frags)
 
 def render_growth(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
+    font_adj = layout_rec.font_adjustment
     add_slide_header(slide, colors, "Growth Strategy & Roadmap", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     add_section_box(slide, colors, 0.3, 0.95, 4.5, 3.8, "Key Growth Drivers", font_adj=font_adj)
-    drivers = parse_lines(data.get("growthDrivers") or data.get("growth_drivers") or "", 6)
+    drivers = parse_lines(data.get("growthDrivers") or "", 6)
     y_pos = 1.5
+    sp_id = slide.shapes._next_shape_id
+    frags = []
+    dot_x, dot_sz = emu(0.5), emu(0.22)
     for d in drivers:
-        c = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(0.5), Inches(y_pos+0.02), Inches(0.22), Inches(0.22))
-        c.fill.solid(); c.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); c.line.fill.background()
-        itb = slide.shapes.add_textbox(Inches(0.5), Inches(y_pos+0.02), Inches(0.22), Inches(0.22))
-        itb.text_frame.paragraphs[0].text = "▶"
-        itb.text_frame.paragraphs[0].font.size = Pt(8)
-        itb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-        itb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        tb = slide.shapes.add_textbox(Inches(0.82), Inches(y_pos), Inches(3.8), Inches(0.3))
-        tb.text_frame.text = truncate_text(d, 50)
-        tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body"], font_adj))
-        tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
+        dot_y = emu(y_pos+0.02)
+        frags += [
+            _solid_shape_xml(sp_id, dot_x, dot_y, dot_sz, dot_sz, colors["secondary"], "ellipse", "Oval"),
+            _textbox_xml(sp_id + 1, dot_x, dot_y, dot_sz, dot_sz, "▶", PT_8, colors["white"], align="ctr"),
+        ]
+        sp_id += 2
         y_pos += 0.45
+    _append_sp_xml(slide, *frags)
+    add_multiline_text(slide, colors, 0.82, 1.5, 3.8, [truncate_text(d, 50) for d in drivers],
+                       font_pt(FONTS["body"], font_adj), 0.45)
     add_section_box(slide, colors, 5.0, 0.95, 4.7, 3.8, "Strategic Goals", colors["secondary"], font_adj)
-    short_goals = parse_lines(data.get("shortTermGoals") or data.get("short_term_goals") or "", 3)
-    medium_goals = parse_lines(data.get("mediumTermGoals") or data.get("medium_term_goals") or "", 3)
+    short_goals = parse_lines(data.get("shortTermGoals") or "", 3)
+    medium_goals = parse_lines(data.get("mediumTermGoals") or "", 3)
     y_pos = 1.5
     if short_goals:
-        tb = slide.shapes.add_textbox(Inches(5.2), Inches(y_pos), Inches(4.3), Inches(0.25))
-        tb.text_frame.text = "Short-Term (0-12 months)"
-        tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_large"], font_adj))
-        tb.text_frame.paragraphs[0].font.bold = True
-        tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["primary"])
+        _append_sp_xml(slide, _textbox_xml(slide.shapes._next_shape_id, emu(5.2), emu(y_pos), emu(4.3), emu(0.25),
+                                           "Short-Term (0-12 months)", font_pt(FONTS["body_large"], font_adj), colors["primary"], bold=True))
         y_pos += 0.35
-        for g in short_goals:
-            tb = slide.shapes.add_textbox(Inches(5.4), Inches(y_pos), Inches(4.1), Inches(0.3))
-            tb.text_frame.text = f"• {truncate_text(g, 40)}"
-            tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_small"], font_adj))
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            y_pos += 0.3
+        add_multiline_text(slide, colors, 5.4, y_pos, 4.1, [f"• {truncate_text(g, 40)}" for g in short_goals],
+                           font_pt(FONTS["body_small"], font_adj), 0.3)
+        y_pos += 0.3*len(short_goals)
     y_pos += 0.15
     if medium_goals:
-        tb = slide.shapes.add_textbox(Inches(5.2), Inches(y_pos), Inches(4.3), Inches(0.25))
-        tb.text_frame.text = "Medium-Term (1-3 years)"
-        tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_large"], font_adj))
-        tb.text_frame.paragraphs[0].font.bold = True
-        tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["primary"])
+        _append_sp_xml(slide, _textbox_xml(slide.shapes._next_shape_id, emu(5.2), emu(y_pos), emu(4.3), emu(0.25),
+                                           "Medium-Term (1-3 years)", font_pt(FONTS["body_large"], font_adj), colors["primary"], bold=True))
         y_pos += 0.35
-        for g in medium_goals:
-            tb = slide.shapes.add_textbox(Inches(5.4), Inches(y_pos), Inches(4.1), Inches(0.3))
-            tb.text_frame.text = f"• {truncate_text(g, 40)}"
-            tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_small"], font_adj))
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            y_pos += 0.3
+        add_multiline_text(slide, colors, 5.4, y_pos, 4.1, [f"• {truncate_text(g, 40)}" for g in medium_goals],
+                           font_pt(FONTS["body_small"], font_adj), 0.3)
+        y_pos += 0.3*len(medium_goals)
 
 def render_market_position(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
-    vertical = data.get("primaryVertical") or "technology"
-    industry_content = get_industry_specific_content(vertical, "market-position")
+    font_adj = layout_rec.font_adjustment
+    industry_content = get_industry_specific_content(context.vertical, "market-position")
     add_slide_header(slide, colors, "Market Position & Competitive Landscape", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     add_section_box(slide, colors, 0.3, 0.95, 4.5, 3.8, "Market Overview", font_adj=font_adj)
-    tam = data.get("marketSize") or data.get("market_size") or "N/A"
-    growth = data.get("marketGrowthRate") or data.get("market_growth_rate") or "N/A"
+    tam = data.get("marketSize") or "N/A"
     add_metric_card(slide, colors, 0.45, 1.5, 4.2, 0.65, tam, "Total Addressable Market", font_adj)
-    add_metric_card(slide, colors, 0.45, 2.35, 4.2, 0.65, f"{growth}%", "Market Growth Rate", font_adj)
+    add_metric_card(slide, colors, 0.45, 2.35, 4.2, 0.65, context.pct.get("marketGrowthRate", "N/A%"), "Market Growth Rate", font_adj)
     if industry_content.get("benchmarks_text"):
-        tb = slide.shapes.add_textbox(Inches(0.45), Inches(3.2), Inches(4.2), Inches(0.4))
-        tb.text_frame.text = industry_content["benchmarks_text"]
-        tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_small"], font_adj))
-        tb.text_frame.paragraphs[0].font.italic = True
-        tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text_light"])
+        add_text_xml(slide, emu(0.45), emu(3.2), emu(4.2), emu(0.4), industry_content["benchmarks_text"],
+                     font_pt(FONTS["body_small"], font_adj), colors["text_light"], italic=True)
     add_section_box(slide, colors, 5.0, 0.95, 4.7, 3.8, "Competitive Advantages", colors["secondary"], font_adj)
-    advantages = parse_pipe_separated(data.get("competitiveAdvantages") or data.get("competitive_advantages") or "", 5)
-    y_pos = 1.5
-    for adv in advantages:
-        if adv:
-            tb = slide.shapes.add_textbox(Inches(5.2), Inches(y_pos), Inches(4.3), Inches(0.4))
-            tb.text_frame.text = f"• {truncate_text(adv[0] if len(adv)>0 else '', 35)}"
-            tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body"], font_adj))
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            y_pos += 0.5
+    advantages = parse_pipe_separated(data.get("competitiveAdvantages") or "", 5)
+    add_multiline_text(slide, colors, 5.2, 1.5, 4.3, [f"• {truncate_text(adv[0] if len(adv)>0 else '', 35)}" for adv in advantages if adv],
+                       font_pt(FONTS["body"], font_adj), 0.5)
 
 def render_synergies(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
-    buyer_types = data.get("targetBuyerType") or ["strategic"]
+    font_adj = layout_rec.font_adjustment
+    buyer_types = context.buyer_types
     add_slide_header(slide, colors, "Strategic Value & Synergies", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     if "strategic" in buyer_types:
         add_section_box(slide, colors, 0.3, 0.95, 4.5, 3.8, "Strategic Synergies", font_adj=font_adj)
-        syns = parse_lines(data.get("synergiesStrategic") or data.get("synergies_strategic") or "", 6)
-        y_pos = 1.5
-        for s in syns:
-            tb = slide.shapes.add_textbox(Inches(0.5), Inches(y_pos), Inches(4.1), Inches(0.4))
-            tb.text_frame.text = f"• {truncate_text(s, 50)}"
-            tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body"], font_adj))
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            y_pos += 0.5
+        syns = parse_lines(data.get("synergiesStrategic") or "", 6)
+        add_bullet_rows(slide, colors, 0.5, 1.5, 4.1, 0.4, [f"• {truncate_text(s, 50)}" for s in syns],
+                        font_pt(FONTS["body"], font_adj), 0.5)
     if "financial" in buyer_types:
         add_section_box(slide, colors, 5.0, 0.95, 4.7, 3.8, "Financial Synergies", colors["secondary"], font_adj)
-        fins = parse_lines(data.get("synergiesFinancial") or data.get("synergies_financial") or "", 6)
-        y_pos = 1.5
-        for s in fins:
-            tb = slide.shapes.add_textbox(Inches(5.2), Inches(y_pos), Inches(4.3), Inches(0.4))
-            tb.text_frame.text = f"• {truncate_text(s, 50)}"
-            tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_small"], font_adj))
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            y_pos += 0.5
+        fins = parse_lines(data.get("synergiesFinancial") or "", 6)
+        add_bullet_rows(slide, colors, 5.2, 1.5, 4.3, 0.4, [f"• {truncate_text(s, 50)}" for s in fins],
+                        font_pt(FONTS["body_small"], font_adj), 0.5)
 
 # ============================================================================
 # TITLE & SPECIAL SLIDES
 # ============================================================================
 def render_title_slide(slide, colors, data, doc_config):
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(10), Inches(5.625))
-    bg.fill.solid(); bg.fill.fore_color.rgb = hex_to_rgb(colors["primary"]); bg.line.fill.background()
-    bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(2.5), Inches(10), Inches(0.1))
-    bar.fill.solid(); bar.fill.fore_color.rgb = hex_to_rgb(colors["accent"]); bar.line.fill.background()
-    company = data.get("companyName") or data.get("company_name") or "Company Name"
-    codename = data.get("projectCodename") or data.get("project_codename") or "Project"
+    company = data.get("companyName") or "Company Name"
+    codename = data.get("projectCodename") or "Project"
     doc_name = doc_config.get("name", "Information Memorandum")
-    ttb = slide.shapes.add_textbox(Inches(1), Inches(1.3), Inches(8), Inches(0.8))
-    ttb.text_frame.text = company
-    ttb.text_frame.paragraphs[0].font.size = Pt(48); ttb.text_frame.paragraphs[0].font.bold = True
-    ttb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    ttb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    stb = slide.shapes.add_textbox(Inches(1), Inches(2.7), Inches(8), Inches(0.5))
-    stb.text_frame.text = doc_name
-    stb.text_frame.paragraphs[0].font.size = Pt(24); stb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    stb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    ctb = slide.shapes.add_textbox(Inches(1), Inches(3.5), Inches(8), Inches(0.4))
-    ctb.text_frame.text = f"Project {codename}"
-    ctb.text_frame.paragraphs[0].font.size = Pt(18); ctb.text_frame.paragraphs[0].font.italic = True
-    ctb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    ctb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    dtb = slide.shapes.add_textbox(Inches(1), Inches(4.8), Inches(8), Inches(0.3))
-    dtb.text_frame.text = format_date(data.get("presentationDate") or data.get("presentation_date"))
-    dtb.text_frame.paragraphs[0].font.size = Pt(14); dtb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    dtb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    advisor = data.get("advisorName") or data.get("advisor_name") or ""
+    white = colors["white"]
+    sp_id = slide.shapes._next_shape_id
+    frags = [
+        _solid_shape_xml(sp_id, *FULL_BLEED, colors["primary"]),
+        _solid_shape_xml(sp_id + 1, 0, emu(2.5), SLIDE_W, emu(0.1), colors["accent"]),
+        _textbox_xml(sp_id + 2, emu(1), emu(1.3), emu(8), emu(0.8), company, Pt(48), white, bold=True, align="ctr"),
+        _textbox_xml(sp_id + 3, emu(1), emu(2.7), emu(8), emu(0.5), doc_name, Pt(24), white, align="ctr"),
+        _textbox_xml(sp_id + 4, emu(1), emu(3.5), emu(8), emu(0.4), f"Project {codename}", Pt(18), white,
+                     italic=True, align="ctr"),
+        _textbox_xml(sp_id + 5, emu(1), emu(4.8), emu(8), emu(0.3), format_date(data.get("presentationDate")),
+                     Pt(14), white, align="ctr"),
+    ]
+    advisor = data.get("advisorName") or ""
     if advisor:
-        atb = slide.shapes.add_textbox(Inches(1), Inches(4.4), Inches(8), Inches(0.3))
-        atb.text_frame.text = f"Prepared by {advisor}"
-        atb.text_frame.paragraphs[0].font.size = Pt(12); atb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-        atb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+        frags.append(_textbox_xml(sp_id + 6, emu(1), emu(4.4), emu(8), emu(0.3), f"Prepared by {advisor}",
+                                  PT_12, white, align="ctr"))
+    _append_sp_xml(slide, *frags)
+
+# Static legal copy shared by every deck; it has no per-deck fields, so no template formatting is needed
+DISCLAIMER_TEXT = """This presentation has been prepared solely for informational purposes. The information contained herein is confidential and proprietary. By accepting this document, you agree to maintain its confidentiality and not to reproduce, distribute, or disclose it without prior written consent.\n\nThis presentation does not constitute an offer to sell or a solicitation to buy securities. Any investment decision should be made only after thorough due diligence and consultation with professional advisors.\n\nThe financial projections and forward-looking statements contained herein are based on assumptions that may or may not prove accurate. Actual results may vary materially."""
+
+@lru_cache(maxsize=16)
+def _disclaimer_sp(text_hex):
+    """Disclaimer textbox parsed once per text colour; callers deepcopy it and assign the shape id"""
+    return parse_xml(_frame_text_xml(0, emu(0.5), emu(1.3), emu(9.0), emu(3.2), DISCLAIMER_TEXT, PT_11, text_hex))
 
 def render_disclaimer_slide(slide, colors, data, page_num):
     add_slide_header(slide, colors, "Disclaimer"); add_slide_footer(slide, colors, page_num)
     add_section_box(slide, colors, 0.3, 0.95, 9.4, 3.8)
-    txt = """This presentation has been prepared solely for informational purposes. The information contained herein is confidential and proprietary. By accepting this document, you agree to maintain its confidentiality and not to reproduce, distribute, or disclose it without prior written consent.\n\nThis presentation does not constitute an offer to sell or a solicitation to buy securities. Any investment decision should be made only after thorough due diligence and consultation with professional advisors.\n\nThe financial projections and forward-looking statements contained herein are based on assumptions that may or may not prove accurate. Actual results may vary materially."""
-    tb = slide.shapes.add_textbox(Inches(0.5), Inches(1.3), Inches(9.0), Inches(3.2))
-    tb.text_frame.text = txt
-    tb.text_frame.paragraphs[0].font.size = Pt(11); tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
+    sp = copy.deepcopy(_disclaimer_sp(colors["text"]))
+    sp_id = slide.shapes._next_shape_id
+    sp.nvSpPr.cNvPr.id = sp_id; sp.nvSpPr.cNvPr.name = f"TextBox {sp_id - 1}"
+    slide.shapes._spTree.insert_element_before(sp, "p:extLst")
 
 def render_thank_you_slide(slide, colors, data, doc_config):
-    bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0), Inches(0), Inches(10), Inches(5.625))
-    bg.fill.solid(); bg.fill.fore_color.rgb = hex_to_rgb(colors["primary"]); bg.line.fill.background()
-    ttb = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(0.8))
-    ttb.text_frame.text = "Thank You"
-    ttb.text_frame.paragraphs[0].font.size = Pt(48); ttb.text_frame.paragraphs[0].font.bold = True
-    ttb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    ttb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    company = data.get("companyName") or data.get("company_name") or ""
+    white = colors["white"]
+    sp_id = slide.shapes._next_shape_id
+    frags = [_solid_shape_xml(sp_id, *FULL_BLEED, colors["primary"]),
+             _frame_text_xml(sp_id + 1, emu(1), emu(2), emu(8), emu(0.8), "Thank You", Pt(48), white, bold=True, align="ctr")]
+    company = data.get("companyName") or ""
     if company:
-        ctb = slide.shapes.add_textbox(Inches(1), Inches(2.9), Inches(8), Inches(0.4))
-        ctb.text_frame.text = company
-        ctb.text_frame.paragraphs[0].font.size = Pt(20); ctb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-        ctb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+        frags.append(_frame_text_xml(sp_id + 2, emu(1), emu(2.9), emu(8), emu(0.4), company, Pt(20), white, align="ctr"))
     parts = []
-    adv = data.get("advisorName") or data.get("advisor_name") or ""
+    adv = data.get("advisorName") or ""
     if adv: parts.append(f"Prepared by {adv}")
-    em = data.get("contactEmail") or data.get("contact_email") or ""
+    em = data.get("contactEmail") or ""
     if em: parts.append(em)
-    ph = data.get("contactPhone") or data.get("contact_phone") or ""
+    ph = data.get("contactPhone") or ""
     if ph: parts.append(ph)
     if parts:
-        ctb2 = slide.shapes.add_textbox(Inches(1), Inches(3.5), Inches(8), Inches(0.8))
-        ctb2.text_frame.text = "\n".join(parts)
-        ctb2.text_frame.paragraphs[0].font.size = Pt(14); ctb2.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-        ctb2.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    ftb = slide.shapes.add_textbox(Inches(1), Inches(4.8), Inches(8), Inches(0.3))
-    ftb.text_frame.text = "Strictly Private & Confidential"
-    ftb.text_frame.paragraphs[0].font.size = Pt(10); ftb.text_frame.paragraphs[0].font.italic = True
-    ftb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    ftb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+        frags.append(_frame_text_xml(sp_id + len(frags), emu(1), emu(3.5), emu(8), emu(0.8), "\n".join(parts), Pt(14), white,
+                                     align="ctr"))
+    frags.append(_frame_text_xml(sp_id + len(frags), emu(1), emu(4.8), emu(8), emu(0.3), CONFIDENTIAL_TEXT, PT_10, white,
+                                 italic=True, align="ctr"))
+    _append_sp_xml(slide, *frags)
 
 # ============================================================================
 # v8.3.0: NEW RENDERERS (TOC, Company Overview, Leadership, Risks)
 # ============================================================================
 def render_toc(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
+    font_adj = layout_rec.font_adjustment
     add_slide_header(slide, colors, "Table of Contents", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
-    labels = {"executive-summary":"Executive Summary","investment-highlights":"Investment Highlights",
-        "company-overview":"Company Overview","services":"Service Lines & Capabilities",
-        "clients":"Client Portfolio","financials":"Financial Performance",
-        "case-study":"Case Studies","growth":"Growth Strategy & Roadmap",
-        "market-position":"Market Position","synergies":"Strategic Value & Synergies",
-        "risks":"Risk Factors & Mitigation","leadership":"Leadership Team"}
-    doc_config = context.get("doc_config", {})
-    entries = []
-    for st in doc_config.get("required_slides", []) + doc_config.get("optional_slides", []):
-        if st in labels: entries.append(labels[st])
-    if not entries: entries = list(labels.values())
-    col1 = entries[:len(entries)//2+1]; col2 = entries[len(entries)//2+1:]
-    for ci, ents in enumerate([col1, col2]):
-        cx = 0.5 + (ci*4.8); yp = 1.1
-        for idx, e in enumerate(ents):
-            sn = idx+1+(ci*len(col1))
-            b = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(cx), Inches(yp+0.02), Inches(0.35), Inches(0.35))
-            b.fill.solid(); b.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); b.line.fill.background()
-            ntb = slide.shapes.add_textbox(Inches(cx), Inches(yp+0.02), Inches(0.35), Inches(0.35))
-            ntb.text_frame.paragraphs[0].text = f"{sn:02d}"
-            ntb.text_frame.paragraphs[0].font.size = Pt(10); ntb.text_frame.paragraphs[0].font.bold = True
-            ntb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-            ntb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            etb = slide.shapes.add_textbox(Inches(cx+0.5), Inches(yp), Inches(3.8), Inches(0.4))
-            etb.text_frame.text = e
-            etb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(13, font_adj))
-            etb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            yp += 0.52
+    doc_config = context.doc_config
+    entries = [TOC_LABELS[st] for st in doc_config.get("required_slides", []) + doc_config.get("optional_slides", [])
+               if st in TOC_LABELS]
+    if not entries: entries = TOC_DEFAULT_ENTRIES
+    # Left column takes the first half (+1); number badge, number and entry per row, appended as one batch
+    mid = len(entries)//2+1
+    entry_size = font_pt(13, font_adj)
+    badge_sz, text_dx, text_w, text_h = emu(0.35), emu(0.5), emu(3.8), emu(0.4)
+    sp_id = slide.shapes._next_shape_id
+    frags = []
+    for i, e in enumerate(entries):
+        col, row = divmod(i, mid)
+        cx = emu(TOC_COL_X[col]); yp = 1.1 + row*0.52; badge_y = emu(yp+0.02)
+        frags += [
+            _solid_shape_xml(sp_id, cx, badge_y, badge_sz, badge_sz, colors["secondary"], "ellipse", "Oval"),
+            _textbox_xml(sp_id + 1, cx, badge_y, badge_sz, badge_sz, f"{i+1:02d}", PT_10, colors["white"],
+                         bold=True, align="ctr"),
+            _textbox_xml(sp_id + 2, cx + text_dx, emu(yp), text_w, text_h, e, entry_size, colors["text"]),
+        ]
+        sp_id += 3
+    _append_sp_xml(slide, *frags)
+
+def render_investment_highlights(slide, colors, data, page_num, layout_rec, context):
+    add_slide_header(slide, colors, "Investment Highlights"); add_slide_footer(slide, colors, page_num)
+    hl = parse_lines(data.get("investmentHighlights") or "", 8)
+    if not hl: return
+    # Bullet, glyph and text per highlight, appended as one batch
+    dot_x, dot_sz, text_x, text_w, text_h = emu(0.5), emu(0.28), emu(0.9), emu(8.8), emu(0.35)
+    sp_id = slide.shapes._next_shape_id
+    frags = []
+    for i, h in enumerate(hl):
+        yp = 1.1 + i*0.45; dot_y = emu(yp+0.02)
+        frags += [
+            _solid_shape_xml(sp_id, dot_x, dot_y, dot_sz, dot_sz, colors["secondary"], "ellipse", "Oval"),
+            _textbox_xml(sp_id + 1, dot_x, dot_y, dot_sz, dot_sz, "✦", PT_10, colors["white"], align="ctr"),
+            _textbox_xml(sp_id + 2, text_x, emu(yp), text_w, text_h, truncate_text(h, 85), PT_12, colors["text"]),
+        ]
+        sp_id += 3
+    _append_sp_xml(slide, *frags)
 
 def render_company_overview(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
+    font_adj = layout_rec.font_adjustment
     add_slide_header(slide, colors, "Company Overview", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     add_section_box(slide, colors, 0.3, 0.95, 5.8, 2.4, "About the Company", font_adj=font_adj)
-    desc = data.get("companyDescription") or data.get("company_description") or ""
-    tb = slide.shapes.add_textbox(Inches(0.45), Inches(1.45), Inches(5.5), Inches(1.7))
-    tb.text_frame.text = truncate_description(desc, 400)
-    tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body"], font_adj))
-    tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-    tb.text_frame.word_wrap = True
+    desc = data.get("companyDescription") or ""
+    add_text_xml(slide, emu(0.45), emu(1.45), emu(5.5), emu(1.7), truncate_description(desc, 400),
+                 font_pt(FONTS["body"], font_adj), colors["text"], wrap=True)
     add_section_box(slide, colors, 6.3, 0.95, 3.4, 2.4, "Key Facts", colors["secondary"], font_adj)
     facts = []
-    if data.get("foundedYear"): facts.append(("Founded", str(data["foundedYear"])))
-    if data.get("headquarters"): facts.append(("Headquarters", truncate_text(str(data["headquarters"]),20)))
-    if data.get("employeeCountFT"): facts.append(("Employees", str(data["employeeCountFT"])))
-    if data.get("revenueFY25"): facts.append(("Revenue FY25", f"INR {data['revenueFY25']} Cr"))
+    if v := data.get("foundedYear"): facts.append(("Founded", str(v)))
+    if v := data.get("headquarters"): facts.append(("Headquarters", truncate_text(str(v),20)))
+    if v := data.get("employeeCountFT"): facts.append(("Employees", str(v)))
+    if v := data.get("revenueFY25"): facts.append(("Revenue FY25", f"INR {v} Cr"))
     fy = 1.5
+    sp_id = slide.shapes._next_shape_id
+    frags = []
+    fact_x, fact_w, label_h, value_h = emu(6.45), emu(3.1), emu(0.18), emu(0.22)
     for lbl, val in facts[:5]:
-        lt = slide.shapes.add_textbox(Inches(6.45), Inches(fy), Inches(3.1), Inches(0.18))
-        lt.text_frame.paragraphs[0].text = lbl
-        lt.text_frame.paragraphs[0].font.size = Pt(9); lt.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text_light"])
-        vt = slide.shapes.add_textbox(Inches(6.45), Inches(fy+0.16), Inches(3.1), Inches(0.22))
-        vt.text_frame.paragraphs[0].text = val
-        vt.text_frame.paragraphs[0].font.size = Pt(12); vt.text_frame.paragraphs[0].font.bold = True
-        vt.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
+        frags += [
+            _textbox_xml(sp_id, fact_x, emu(fy), fact_w, label_h, lbl, PT_9, colors["text_light"]),
+            _textbox_xml(sp_id + 1, fact_x, emu(fy+0.16), fact_w, value_h, val, PT_12, colors["text"], bold=True),
+        ]
+        sp_id += 2
         fy += 0.42
+    _append_sp_xml(slide, *frags)
     metrics = []
-    if data.get("topClientCount") or data.get("totalClients"):
-        metrics.append((str(data.get("topClientCount") or data.get("totalClients","")), "Total Clients", "●"))
-    if data.get("top10Concentration"):
-        metrics.append((f"{data['top10Concentration']}%", "Top 10 Conc.", "◆"))
-    if data.get("netRetention"):
-        metrics.append((f"{data['netRetention']}%", "Net Retention", "★"))
-    if data.get("ebitdaMarginFY25"):
-        metrics.append((f"{data['ebitdaMarginFY25']}%", "EBITDA Margin", "▲"))
+    if v := data.get("topClientCount") or data.get("totalClients"):
+        metrics.append((str(v), "Total Clients", "●"))
+    pct = context.pct
+    if v := pct.get("top10Concentration"):
+        metrics.append((v, "Top 10 Conc.", "◆"))
+    if v := pct.get("netRetention"):
+        metrics.append((v, "Net Retention", "★"))
+    if v := pct.get("ebitdaMarginFY25"):
+        metrics.append((v, "EBITDA Margin", "▲"))
     if metrics: add_metric_row(slide, colors, metrics, y=3.6, font_adj=font_adj)
 
 def render_leadership(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
+    font_adj = layout_rec.font_adjustment
     add_slide_header(slide, colors, "Leadership Team", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
-    leadership_text = data.get("leadershipTeam") or data.get("leadership_team") or ""
+    leadership_text = data.get("leadershipTeam") or ""
     team = parse_pipe_separated(leadership_text, 8)
     if not team:
         fn = data.get("founderName") or ""
@@ -766,61 +871,50 @@ def render_leadership(slide, colors, data, page_num, layout_rec, context):
     # Tier 1: CEO card
     m = team[0]; name = m[0] if len(m)>0 else ""; title = m[1] if len(m)>1 else ""
     cw = 3.5; cx = (10-cw)/2
-    psz = 0.7
-    p = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(cx+(cw-psz)/2), Inches(1.05), Inches(psz), Inches(psz))
-    p.fill.solid(); p.fill.fore_color.rgb = hex_to_rgb(colors["border"])
-    p.line.color.rgb = hex_to_rgb(colors["primary"])
+    psz = 0.7; px = emu(cx+(cw-psz)/2)
     inits = "".join([w[0].upper() for w in name.split()[:2]]) if name else ""
-    itb = slide.shapes.add_textbox(Inches(cx+(cw-psz)/2), Inches(1.05), Inches(psz), Inches(psz))
-    itb.text_frame.paragraphs[0].text = inits
-    itb.text_frame.paragraphs[0].font.size = Pt(18); itb.text_frame.paragraphs[0].font.bold = True
-    itb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["primary"])
-    itb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    nc = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(cx), Inches(1.85), Inches(cw), Inches(0.65))
-    nc.fill.solid(); nc.fill.fore_color.rgb = hex_to_rgb(colors["primary"]); nc.line.fill.background()
-    ntb = slide.shapes.add_textbox(Inches(cx+0.1), Inches(1.87), Inches(cw-0.2), Inches(0.3))
-    ntb.text_frame.paragraphs[0].text = truncate_text(name, 35)
-    ntb.text_frame.paragraphs[0].font.size = Pt(13); ntb.text_frame.paragraphs[0].font.bold = True
-    ntb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    ntb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    ttb = slide.shapes.add_textbox(Inches(cx+0.1), Inches(2.17), Inches(cw-0.2), Inches(0.25))
-    ttb.text_frame.paragraphs[0].text = truncate_text(title, 35)
-    ttb.text_frame.paragraphs[0].font.size = Pt(10); ttb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-    ttb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    sp_id = slide.shapes._next_shape_id
+    _append_sp_xml(slide,
+        _solid_shape_xml(sp_id, px, emu(1.05), emu(psz), emu(psz), colors["border"], "ellipse", "Oval", line_hex=colors["primary"]),
+        _textbox_xml(sp_id + 1, px, emu(1.05), emu(psz), emu(psz), inits, Pt(18), colors["primary"], bold=True, align="ctr"),
+        _solid_shape_xml(sp_id + 2, emu(cx), emu(1.85), emu(cw), emu(0.65), colors["primary"]),
+        _textbox_xml(sp_id + 3, emu(cx+0.1), emu(1.87), emu(cw-0.2), emu(0.3), truncate_text(name, 35), Pt(13),
+                     colors["white"], bold=True, align="ctr"),
+        _textbox_xml(sp_id + 4, emu(cx+0.1), emu(2.17), emu(cw-0.2), emu(0.25), truncate_text(title, 35), PT_10,
+                     colors["white"], align="ctr"))
     # Tier 2
     rem = team[1:7]
     if rem:
         num = len(rem); cols = min(num,3); gap = 0.2; cw2 = 2.8
         tw = (cols*cw2)+((cols-1)*gap); sx = (10-tw)/2; sy = 2.75
+        frags = []
+        sp_id = slide.shapes._next_shape_id
         for idx, m in enumerate(rem):
             r = idx//cols; c = idx%cols
             mx = sx + c*(cw2+gap); my = sy + r*1.2
             n2 = m[0] if len(m)>0 else ""; t2 = m[1] if len(m)>1 else ""
-            cd = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(mx), Inches(my), Inches(cw2), Inches(0.95))
-            cd.fill.solid(); cd.fill.fore_color.rgb = hex_to_rgb(colors["light_bg"])
-            cd.line.color.rgb = hex_to_rgb(colors["border"])
-            ac = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(mx), Inches(my), Inches(0.06), Inches(0.95))
-            ac.fill.solid(); ac.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); ac.line.fill.background()
-            nt = slide.shapes.add_textbox(Inches(mx+0.15), Inches(my+0.1), Inches(cw2-0.25), Inches(0.3))
-            nt.text_frame.paragraphs[0].text = truncate_text(n2,30)
-            nt.text_frame.paragraphs[0].font.size = Pt(11); nt.text_frame.paragraphs[0].font.bold = True
-            nt.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            tt = slide.shapes.add_textbox(Inches(mx+0.15), Inches(my+0.4), Inches(cw2-0.25), Inches(0.45))
-            tt.text_frame.paragraphs[0].text = truncate_text(t2,40)
-            tt.text_frame.paragraphs[0].font.size = Pt(9); tt.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text_light"])
-            tt.text_frame.word_wrap = True
+            frags += [
+                _solid_shape_xml(sp_id, emu(mx), emu(my), emu(cw2), emu(0.95), colors["light_bg"], line_hex=colors["border"]),
+                _solid_shape_xml(sp_id + 1, emu(mx), emu(my), emu(0.06), emu(0.95), colors["secondary"]),
+                _textbox_xml(sp_id + 2, emu(mx+0.15), emu(my+0.1), emu(cw2-0.25), emu(0.3), truncate_text(n2,30),
+                             PT_11, colors["text"], bold=True),
+                _textbox_xml(sp_id + 3, emu(mx+0.15), emu(my+0.4), emu(cw2-0.25), emu(0.45), truncate_text(t2,40),
+                             PT_9, colors["text_light"], wrap=True),
+            ]
+            sp_id += 4
+        _append_sp_xml(slide, *frags)
 
 def render_risk_factors(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", 0)
+    font_adj = layout_rec.font_adjustment
     add_slide_header(slide, colors, "Risk Factors & Mitigation", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     risks = []
-    if data.get("businessRisks"): risks.append(("Business Risks", data["businessRisks"]))
-    if data.get("marketRisks"): risks.append(("Market Risks", data["marketRisks"]))
-    if data.get("operationalRisks"): risks.append(("Operational Risks", data["operationalRisks"]))
-    if data.get("mitigationStrategies"): risks.append(("Mitigation Strategies", data["mitigationStrategies"]))
-    if not risks and data.get("riskFactors"):
-        items = parse_lines(data["riskFactors"], 8)
+    if v := data.get("businessRisks"): risks.append(("Business Risks", v))
+    if v := data.get("marketRisks"): risks.append(("Market Risks", v))
+    if v := data.get("operationalRisks"): risks.append(("Operational Risks", v))
+    if v := data.get("mitigationStrategies"): risks.append(("Mitigation Strategies", v))
+    if not risks and (v := data.get("riskFactors")):
+        items = parse_lines(v, 8)
         if items: risks.append(("Key Risk Factors", "\n".join(items)))
     if not risks: return
     num = len(risks)
@@ -829,145 +923,138 @@ def render_risk_factors(slide, colors, data, page_num, layout_rec, context):
             bx = 0.3 + (i*4.85); bw = 4.55
             hc = colors["accent"] if "Mitigation" in cat else colors["primary"]
             add_section_box(slide, colors, bx, 0.95, bw, 3.8, cat, hc, font_adj)
-            tb = slide.shapes.add_textbox(Inches(bx+0.15), Inches(1.45), Inches(bw-0.3), Inches(3.1))
-            tb.text_frame.text = truncate_description(content, 350)
-            tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(DESIGN["fonts"]["body_small"], font_adj))
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            tb.text_frame.word_wrap = True
+            add_text_xml(slide, emu(bx+0.15), emu(1.45), emu(bw-0.3), emu(3.1), truncate_description(content, 350),
+                         font_pt(FONTS["body_small"], font_adj), colors["text"], wrap=True)
     else:
         rh = min(0.9, 3.8/num - 0.05); yp = 0.95
-        hcs = [colors["primary"], colors["accent"], colors["secondary"], colors.get("warning","D69E2E")]
-        for i, (cat, content) in enumerate(risks):
-            hc = hcs[i % len(hcs)]
-            hdr = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.3), Inches(yp), Inches(9.4), Inches(0.3))
-            hdr.fill.solid(); hdr.fill.fore_color.rgb = hex_to_rgb(hc); hdr.line.fill.background()
-            htb = slide.shapes.add_textbox(Inches(0.42), Inches(yp+0.02), Inches(9.1), Inches(0.26))
-            htb.text_frame.paragraphs[0].text = cat
-            htb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(11, font_adj)); htb.text_frame.paragraphs[0].font.bold = True
-            htb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-            cbg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.3), Inches(yp+0.3), Inches(9.4), Inches(rh-0.3))
-            cbg.fill.solid(); cbg.fill.fore_color.rgb = hex_to_rgb(colors["light_bg"])
-            cbg.line.color.rgb = hex_to_rgb(colors["border"])
-            ctb = slide.shapes.add_textbox(Inches(0.45), Inches(yp+0.35), Inches(9.1), Inches(rh-0.4))
-            ctb.text_frame.text = truncate_description(content, 180)
-            ctb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(10, font_adj))
-            ctb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            ctb.text_frame.word_wrap = True
+        # Header colours cycle through a fixed ring
+        header_ring = cycle((colors["primary"], colors["accent"], colors["secondary"], colors.get("warning","D69E2E")))
+        title_pt, body_pt = font_pt(11, font_adj), font_pt(10, font_adj)
+        # Only the row offset varies per risk
+        bar_x, bar_w, bar_h, text_w = emu(0.3), emu(9.4), emu(0.3), emu(9.1)
+        panel_h, body_h = emu(rh-0.3), emu(rh-0.4)
+        sp_id = slide.shapes._next_shape_id
+        frags = []
+        for (cat, content), hc in zip(risks, header_ring):
+            frags += [
+                _solid_shape_xml(sp_id, bar_x, emu(yp), bar_w, bar_h, hc),
+                _textbox_xml(sp_id + 1, emu(0.42), emu(yp+0.02), text_w, emu(0.26), cat, title_pt, colors["white"], bold=True),
+                _solid_shape_xml(sp_id + 2, bar_x, emu(yp+0.3), bar_w, panel_h, colors["light_bg"],
+                                 line_hex=colors["border"]),
+                _frame_text_xml(sp_id + 3, emu(0.45), emu(yp+0.35), text_w, body_h, truncate_description(content, 180),
+                                body_pt, colors["text"], wrap=True),
+            ]
+            sp_id += 4
             yp += rh + 0.05
+        _append_sp_xml(slide, *frags)
 
 # ============================================================================
 # APPENDIX SLIDES
 # ============================================================================
 def render_appendix_financials(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", -1)
+    font_adj = layout_rec.font_adjustment
     add_slide_header(slide, colors, "Appendix A: Detailed Financial Information", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     add_section_box(slide, colors, 0.3, 0.95, 9.4, 3.8, "Financial Details")
     yp = 1.5
+    title_pt, body_pt = font_pt(12, font_adj), font_pt(10, font_adj)
+    sp_id = slide.shapes._next_shape_id
+    frags = []
     for st, content in [("Revenue Breakdown by Service Line", data.get("revenueByService") or ""),
                         ("Cost Structure Analysis", data.get("costStructure") or ""),
                         ("Working Capital Requirements", data.get("workingCapital") or "")]:
         if content:
-            tt = slide.shapes.add_textbox(Inches(0.5), Inches(yp), Inches(9.0), Inches(0.25))
-            tt.text_frame.text = st
-            tt.text_frame.paragraphs[0].font.size = Pt(adjusted_font(12, font_adj))
-            tt.text_frame.paragraphs[0].font.bold = True
-            tt.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["primary"])
-            ct = slide.shapes.add_textbox(Inches(0.5), Inches(yp+0.3), Inches(9.0), Inches(0.6))
-            ct.text_frame.text = truncate_description(content, 300)
-            ct.text_frame.paragraphs[0].font.size = Pt(adjusted_font(10, font_adj))
-            ct.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
+            # Title + content share one text frame (two paragraphs, one shape)
+            frags.append(_text_frame_xml(sp_id + len(frags), emu(0.5), emu(yp), emu(9.0), emu(0.9), (
+                _paragraph_xml(st, title_pt, colors["primary"], bold=True),
+                _paragraph_xml(truncate_description(content, 300), body_pt, colors["text"]))))
             yp += 1.0
+    _append_sp_xml(slide, *frags)
 
 def render_appendix_case_studies(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", -1)
+    font_adj = layout_rec.font_adjustment
     add_slide_header(slide, colors, "Appendix B: Additional Case Studies", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     add_section_box(slide, colors, 0.3, 0.95, 9.4, 3.8)
     cs = data.get("caseStudies") or []; extra = cs[2:] if len(cs)>2 else []
     yp = 1.3
+    title_pt, body_pt = font_pt(12, font_adj), font_pt(9, font_adj)
+    sp_id = slide.shapes._next_shape_id
+    frags = []
     for s in extra[:2]:
         cl = s.get("client","Client")
-        tt = slide.shapes.add_textbox(Inches(0.5), Inches(yp), Inches(9.0), Inches(0.25))
-        tt.text_frame.text = f"Case Study: {truncate_text(cl, 60)}"
-        tt.text_frame.paragraphs[0].font.size = Pt(adjusted_font(12, font_adj)); tt.text_frame.paragraphs[0].font.bold = True
-        tt.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["primary"])
-        yp += 0.3
-        c = f"Challenge: {truncate_text(s.get('challenge',''),100)} | Solution: {truncate_text(s.get('solution',''),100)} | Results: {truncate_text(s.get('results',''),100)}"
-        ct = slide.shapes.add_textbox(Inches(0.5), Inches(yp), Inches(9.0), Inches(0.6))
-        ct.text_frame.text = c
-        ct.text_frame.paragraphs[0].font.size = Pt(adjusted_font(9, font_adj))
-        ct.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-        yp += 0.9
+        body = f"Challenge: {truncate_text(s.get('challenge',''),100)} | Solution: {truncate_text(s.get('solution',''),100)} | Results: {truncate_text(s.get('results',''),100)}"
+        frags.append(_text_frame_xml(sp_id + len(frags), emu(0.5), emu(yp), emu(9.0), emu(0.9), (
+            _paragraph_xml(f"Case Study: {truncate_text(cl, 60)}", title_pt, colors["primary"], bold=True),
+            _paragraph_xml(body, body_pt, colors["text"]))))
+        yp += 1.2
+    _append_sp_xml(slide, *frags)
 
 def render_appendix_team_bios(slide, colors, data, page_num, layout_rec, context):
-    font_adj = layout_rec.get("font_adjustment", -1)
+    font_adj = layout_rec.font_adjustment
     add_slide_header(slide, colors, "Appendix C: Detailed Team Biographies", font_adj=font_adj)
     add_slide_footer(slide, colors, page_num)
     add_section_box(slide, colors, 0.3, 0.95, 9.4, 3.8)
-    lt = data.get("leadershipTeam") or data.get("leadership_team") or ""
+    lt = data.get("leadershipTeam") or ""
     team = parse_pipe_separated(lt, 4)
-    yp = 1.3
-    for m in team:
-        if m and len(m) >= 2:
-            tb = slide.shapes.add_textbox(Inches(0.5), Inches(yp), Inches(9.0), Inches(0.4))
-            tb.text_frame.text = f"• {m[0]} — {m[1]}"
-            tb.text_frame.paragraphs[0].font.size = Pt(adjusted_font(11, font_adj))
-            tb.text_frame.paragraphs[0].font.bold = True
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            yp += 0.5
+    bios = [f"• {m[0]} — {m[1]}" for m in team if m and len(m) >= 2]
+    add_multiline_text(slide, colors, 0.5, 1.3, 9.0, bios, font_pt(11, font_adj), 0.5, bold=True)
 
 # ============================================================================
 # UNIVERSAL createSlide() WRAPPER
 # ============================================================================
-def create_slide(slide_type: str, prs: Presentation, colors: dict, data: dict, page_num: int, context: dict) -> Optional[int]:
-    # Guard clauses
-    if slide_type == "case-study" and not data.get("caseStudies") and not data.get("cs1Client"): return None
-    if slide_type == "financials" and not (data.get("revenueFY24") or data.get("revenueFY25")): return None
-    if slide_type == "market-position" and not (data.get("marketSize") or data.get("competitiveAdvantages")): return None
-    if slide_type == "synergies" and not (data.get("synergiesStrategic") or data.get("synergiesFinancial")): return None
-    if slide_type == "appendix-team-bios" and not data.get("teamBios") and not data.get("leadershipTeam"): return None
-    if slide_type == "appendix-case-studies":
-        if len(data.get("caseStudies") or []) <= 2: return None
+DEFAULT_INDUSTRY_DATA = INDUSTRY_DATA["technology"]
 
-    blank_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(blank_layout)
-    layout_rec = analyze_data_for_layout_sync(data, slide_type)
+# Slides rendered without a layout recommendation (no AI call needed)
+NO_LAYOUT_SLIDES = frozenset({"title", "disclaimer", "investment-highlights", "section-divider", "thank-you"})
+
+# Slide types whose renderer takes the standard arguments and always fills one numbered page
+SLIDE_RENDERERS = {
+    "toc": render_toc,
+    "executive-summary": render_executive_summary,
+    "investment-highlights": render_investment_highlights,
+    "company-overview": render_company_overview,
+    "services": render_services,
+    "clients": render_clients,
+    "financials": render_financials,
+    "growth": render_growth,
+    "market-position": render_market_position,
+    "leadership": render_leadership,
+    "synergies": render_synergies,
+    "risks": render_risk_factors,
+    "appendix-financials": render_appendix_financials,
+    "appendix-case-studies": render_appendix_case_studies,
+    "appendix-team-bios": render_appendix_team_bios,
+}
+
+# Slide types that are dropped when their source fields are empty; checked once
+# per deck before layout analysis, so skipped slides never reach create_slide
+SLIDE_GUARDS = {
+    "case-study": lambda d: d.get("caseStudies") or d.get("cs1Client"),
+    "financials": lambda d: d.get("revenueFY24") or d.get("revenueFY25"),
+    "market-position": lambda d: d.get("marketSize") or d.get("competitiveAdvantages"),
+    "synergies": lambda d: d.get("synergiesStrategic") or d.get("synergiesFinancial"),
+    "appendix-team-bios": lambda d: d.get("teamBios") or d.get("leadershipTeam"),
+    "appendix-case-studies": lambda d: len(d.get("caseStudies") or []) > 2,
+}
+
+def filter_renderable_slides(slides: list, data: dict) -> list:
+    """Drop slide types whose guard fails for this data"""
+    return [st for st in slides if (guard := SLIDE_GUARDS.get(st)) is None or guard(data)]
 
+def create_slide(slide_type: str, prs: Presentation, colors: dict, data: dict, page_num: int, context: SlideContext) -> Optional[int]:
+    # Guard clauses run once per deck in filter_renderable_slides
+    slide = prs.slides.add_slide(context.blank_layout)
+    layout_rec = context.layouts.get(slide_type)
+    if layout_rec is None and slide_type not in NO_LAYOUT_SLIDES:
+        layout_rec = LayoutRec.from_dict(analyze_data_for_layout_sync(data, slide_type))
+
+    if (render := SLIDE_RENDERERS.get(slide_type)) is not None:
+        render(slide, colors, data, page_num, layout_rec, context); return page_num + 1
     if slide_type == "title":
-        render_title_slide(slide, colors, data, context.get("doc_config", {})); return None
+        render_title_slide(slide, colors, data, context.doc_config); return None
     elif slide_type == "disclaimer":
         render_disclaimer_slide(slide, colors, data, page_num); return page_num + 1
-    elif slide_type == "toc":
-        render_toc(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "executive-summary":
-        render_executive_summary(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "investment-highlights":
-        add_slide_header(slide, colors, "Investment Highlights"); add_slide_footer(slide, colors, page_num)
-        hl = parse_lines(data.get("investmentHighlights") or "", 8)
-        yp = 1.1
-        for i, h in enumerate(hl):
-            c = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(0.5), Inches(yp+0.02), Inches(0.28), Inches(0.28))
-            c.fill.solid(); c.fill.fore_color.rgb = hex_to_rgb(colors["secondary"]); c.line.fill.background()
-            itb = slide.shapes.add_textbox(Inches(0.5), Inches(yp+0.02), Inches(0.28), Inches(0.28))
-            itb.text_frame.paragraphs[0].text = "✦"
-            itb.text_frame.paragraphs[0].font.size = Pt(10)
-            itb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["white"])
-            itb.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            tb = slide.shapes.add_textbox(Inches(0.9), Inches(yp), Inches(8.8), Inches(0.35))
-            tb.text_frame.text = truncate_text(h, 85)
-            tb.text_frame.paragraphs[0].font.size = Pt(12)
-            tb.text_frame.paragraphs[0].font.color.rgb = hex_to_rgb(colors["text"])
-            yp += 0.45
-        return page_num + 1
-    elif slide_type == "company-overview":
-        render_company_overview(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "services":
-        render_services(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "clients":
-        render_clients(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "financials":
-        render_financials(slide, colors, data, page_num, layout_rec, context); return page_num + 1
     elif slide_type == "case-study":
         cs = data.get("caseStudies") or []
         if not cs and data.get("cs1Client"):
@@ -975,28 +1062,12 @@ def create_slide(slide_type: str, prs: Presentation, colors: dict, data: dict, p
                         "solution": data.get("cs1Solution"), "results": data.get("cs1Results")})
         if cs: render_case_study(slide, colors, data, page_num, cs[0], layout_rec, context); return page_num + 1
         return None
-    elif slide_type == "growth":
-        render_growth(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "market-position":
-        render_market_position(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "leadership":
-        render_leadership(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "synergies":
-        render_synergies(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "risks":
-        render_risk_factors(slide, colors, data, page_num, layout_rec, context); return page_num + 1
     elif slide_type == "section-divider":
         st = data.get("_section_divider_title", "Section")
         sn = data.get("_section_divider_num")
         render_section_divider(slide, colors, st, sn); return None
-    elif slide_type == "appendix-financials":
-        render_appendix_financials(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "appendix-case-studies":
-        render_appendix_case_studies(slide, colors, data, page_num, layout_rec, context); return page_num + 1
-    elif slide_type == "appendix-team-bios":
-        render_appendix_team_bios(slide, colors, data, page_num, layout_rec, context); return page_num + 1
     elif slide_type == "thank-you":
-        render_thank_you_slide(slide, colors, data, context.get("doc_config", {})); return None
+        render_thank_you_slide(slide, colors, data, context.doc_config); return None
     else:
         return None
 
@@ -1005,34 +1076,50 @@ def create_slide(slide_type: str, prs: Presentation, colors: dict, data: dict, p
 # ============================================================================
 def generate_presentation(data: Dict, theme: str = "modern-blue") -> Presentation:
     if isinstance(data, str):
-        import json
         try: data = json.loads(data)
         except: data = {}
     if not isinstance(data, dict): data = {}
-    if not data.get("companyName") and not data.get("company_name"): data["companyName"] = "Company Name"
-    if not data.get("documentType") and not data.get("document_type"): data["documentType"] = "management-presentation"
+    data = normalize_form_keys(data)
+    if not data.get("companyName"): data["companyName"] = "Company Name"
+    if not data.get("documentType"): data["documentType"] = "management-presentation"
     try:
-        prs = Presentation(); prs.slide_width = Inches(10); prs.slide_height = Inches(5.625)
+        prs = Presentation(); prs.slide_width = SLIDE_W; prs.slide_height = SLIDE_H
+        _count_chart_partnames(prs.part.package)
     except Exception as e:
         print(f"ERROR: Failed to create presentation: {e}"); raise
-    try: colors = get_theme_colors(theme)
-    except: colors = get_theme_colors("modern-blue")
-    doc_type = (data.get("documentType") or data.get("document_type") or "management-presentation").lower()
-    if doc_type not in ["management-presentation","cim","teaser"]: doc_type = "management-presentation"
-    doc_config = DOCUMENT_CONFIGS.get(doc_type, DOCUMENT_CONFIGS["management-presentation"])
-    primary_vertical = (data.get("primaryVertical") or data.get("primary_vertical") or "technology").lower()
-    industry_data = INDUSTRY_DATA.get(primary_vertical, INDUSTRY_DATA.get("technology", {}))
-    context = {"doc_config": doc_config, "industry_data": industry_data,
-               "buyer_types": data.get("targetBuyerType") or data.get("target_buyer_type") or ["strategic"]}
+    colors = get_theme_colors(theme)  # unknown ids fall back to the first (modern-blue) template
+    # Content slides take their white from the blank layout's background, not a full-bleed shape per slide
+    blank_layout = prs.slide_layouts[6]
+    blank_layout.background.fill.solid(); blank_layout.background.fill.fore_color.rgb = RGBColor.from_string(_hex_val(colors["white"]))
+    doc_type = (data.get("documentType") or "management-presentation").lower()
+    if doc_type not in DOCUMENT_CONFIGS: doc_type = "management-presentation"
+    doc_config = DOCUMENT_CONFIGS[doc_type]
+    vertical = data.get("primaryVertical") or "technology"
+    primary_vertical = vertical.lower()
+    industry_data = INDUSTRY_DATA.get(primary_vertical, DEFAULT_INDUSTRY_DATA)
     try: slides_to_generate = get_slides_for_document_type(doc_type, data)
     except Exception as e:
         print(f"ERROR: Failed to determine slides: {e}")
-        import traceback; traceback.print_exc()
+        traceback.print_exc()
         slides_to_generate = ["title","disclaimer","executive-summary","services","clients","financials","thank-you"]
+    slides_to_generate = filter_renderable_slides(slides_to_generate, data)
+    layout_types = [st for st in slides_to_generate if st not in NO_LAYOUT_SLIDES]
+    layouts = {st: LayoutRec.from_dict(rec) for st, rec in analyze_layouts_concurrently(data, layout_types).items()}
+    context = SlideContext(doc_config=doc_config, industry_data=industry_data,
+                           buyer_types=data.get("targetBuyerType") or ["strategic"],
+                           layouts=layouts, blank_layout=blank_layout, revenue=revenue_series(data),
+                           vertical=vertical, pct=percent_labels(data))
     print(f"=== GENERATION SUMMARY (v8.3.0) ===")
     print(f"Document Type: {doc_type} | Industry: {primary_vertical} | Theme: {theme}")
     print(f"Slides ({len(slides_to_generate)}): {slides_to_generate}")
     print(f"====================================")
+    # Rendering stays sequential: slides share one package, chart parts get
+    # package-wide partnames and python-pptx objects aren't thread-safe. The
+    # I/O-bound part (AI layout calls) is already prefetched concurrently.
+    # Worker processes don't pay off either: a full CIM renders in ~0.15s,
+    # less than spawning a pool, and slides with charts would still need their
+    # chart/workbook parts re-wired into this package afterwards. Concurrent
+    # decks already run on separate threads (see app.generate_pptx).
     page_num = 1; slides_created = 0
     for slide_type in slides_to_generate:
         try:
@@ -1042,7 +1129,7 @@ def generate_presentation(data: Dict, theme: str = "modern-blue") -> Presentatio
             print(f"✓ Created slide: {slide_type}")
         except Exception as e:
             print(f"✗ ERROR creating slide '{slide_type}': {e}")
-            import traceback; traceback.print_exc()
+            traceback.print_exc()
             continue
     print(f"=== GENERATION COMPLETE (v8.3.0) ===")
     print(f"Total slides created: {slides_created}/{len(slides_to_generate)}")
@@ -0,0 +1,125 @@
+"""
+Tests for the AI layout engine's concurrent prefetch and its layout cache.
+
+The Anthropic client is replaced with a fake so no network calls are made.
+Run from server/: python -m unittest discover -s tests
+"""
+
+import asyncio
+import os
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import ai_layout_engine
+
+AI_REPLY = '{"content_density": "from-ai"}'
+
+
+class FakeAnthropic:
+    """Stands in for anthropic.Anthropic; every call runs on_create() and returns AI_REPLY"""
+
+    def __init__(self, on_create=None):
+        self.on_create = on_create
+        self.calls = 0
+        self.lock = threading.Lock()
+        self.messages = SimpleNamespace(create=self._create)
+
+    def __call__(self, api_key):
+        return self
+
+    def _create(self, **kwargs):
+        with self.lock:
+            self.calls += 1
+        if self.on_create:
+            self.on_create()
+        return SimpleNamespace(usage=SimpleNamespace(input_tokens=1, output_tokens=1),
+                               content=[SimpleNamespace(text=AI_REPLY)])
+
+
+class LayoutEngineTestCase(unittest.TestCase):
+    def setUp(self):
+        ai_layout_engine._layout_cache.clear()
+        self.addCleanup(ai_layout_engine._layout_cache.clear)
+        for patcher in (mock.patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key", "DISABLE_AI_LAYOUT": ""}),
+                        mock.patch.object(ai_layout_engine, "get_tracker",
+                                          return_value=SimpleNamespace(track_call=lambda **kw: None)),
+                        mock.patch("builtins.print")):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def use_client(self, client):
+        patcher = mock.patch.object(ai_layout_engine.anthropic, "Anthropic", client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return client
+
+
+class AnalyzeLayoutsConcurrentlyTest(LayoutEngineTestCase):
+    SLIDES = ["executive-summary", "services", "financials"]
+
+    def test_calls_run_in_parallel(self):
+        # Every call waits for the others; run one at a time they would time out into defaults
+        barrier = threading.Barrier(len(self.SLIDES), timeout=5)
+        client = self.use_client(FakeAnthropic(on_create=barrier.wait))
+        layouts = ai_layout_engine.analyze_layouts_concurrently({}, self.SLIDES)
+        self.assertEqual(list(layouts), self.SLIDES)
+        self.assertTrue(all(rec["content_density"] == "from-ai" for rec in layouts.values()))
+        self.assertEqual(client.calls, len(self.SLIDES))
+
+    def test_duplicate_slide_types_are_fetched_once(self):
+        client = self.use_client(FakeAnthropic())
+        layouts = ai_layout_engine.analyze_layouts_concurrently({}, ["services", "clients", "services"])
+        self.assertEqual(list(layouts), ["services", "clients"])
+        self.assertEqual(client.calls, 2)
+
+    def test_without_api_key_defaults_are_used(self):
+        client = self.use_client(FakeAnthropic())
+        with mock.patch.dict(os.environ, {"ANTHROPIC_API_KEY": ""}):
+            layouts = ai_layout_engine.analyze_layouts_concurrently({}, self.SLIDES)
+        self.assertEqual(client.calls, 0)
+        self.assertTrue(all(rec.get("content_density") != "from-ai" for rec in layouts.values()))
+
+
+class LayoutCacheTest(LayoutEngineTestCase):
+    def test_repeated_preview_is_served_from_cache(self):
+        client = self.use_client(FakeAnthropic())
+        first = ai_layout_engine.analyze_data_for_layout_sync({}, "services")
+        second = ai_layout_engine.analyze_data_for_layout_sync({}, "services")
+        self.assertEqual(client.calls, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(second["content_density"], "from-ai")
+
+    def test_async_and_sync_entry_points_share_the_cache(self):
+        client = self.use_client(FakeAnthropic())
+        ai_layout_engine.analyze_data_for_layout_sync({}, "services")
+        layout = asyncio.run(ai_layout_engine.analyze_data_for_layout({}, "services"))
+        self.assertEqual(client.calls, 1)
+        self.assertEqual(layout["content_density"], "from-ai")
+
+    def test_callers_get_copies(self):
+        self.use_client(FakeAnthropic())
+        first = ai_layout_engine.analyze_data_for_layout_sync({}, "services")
+        first["content_density"] = "mutated"
+        self.assertEqual(ai_layout_engine.analyze_data_for_layout_sync({}, "services")["content_density"], "from-ai")
+
+    def test_failed_requests_are_not_cached(self):
+        self.assertIsNone(ai_layout_engine._cached_layout(("services", "{}"), lambda: None))
+        self.assertEqual(ai_layout_engine._layout_cache, {})
+
+    def test_evicts_oldest_entry_when_full(self):
+        cap = ai_layout_engine.LAYOUT_CACHE_MAX
+        self.assertEqual(cap, 512)
+        for i in range(cap):
+            ai_layout_engine._cached_layout(("slide", str(i)), lambda i=i: {"n": i})
+        self.assertEqual(ai_layout_engine._cached_layout(("slide", "0"), lambda: {"n": "recomputed"}), {"n": 0})
+        ai_layout_engine._cached_layout(("slide", "new"), lambda: {"n": "new"})
+        self.assertEqual(len(ai_layout_engine._layout_cache), cap)
+        self.assertNotIn(("slide", "0"), ai_layout_engine._layout_cache)
+        self.assertIn(("slide", "1"), ai_layout_engine._layout_cache)
+        self.assertIn(("slide", "new"), ai_layout_engine._layout_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+Tests for pptx_generator: per-deck helpers and full renders.
+
+Run from server/: python -m unittest discover -s tests
+"""
+
+import io
+import os
+import re
+import unittest
+from unittest import mock
+
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Pt
+
+from models import get_theme_colors
+from pptx_generator import (
+    _append_sp_xml, _frame_text_xml, _paragraph_xml, _solid_shape_xml, _text_frame_xml, _textbox_xml,
+    add_multiline_text, emu, filter_renderable_slides, generate_presentation, percent_labels, revenue_series,
+)
+
+
+def blank_slide():
+    prs = Presentation()
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def slide_texts(prs):
+    return [sh.text_frame.text for slide in prs.slides for sh in slide.shapes if sh.has_text_frame]
+
+
+def c14n(element):
+    return etree.tostring(element, method="c14n")
+
+
+class PercentLabelsTest(unittest.TestCase):
+    def test_filled_fields_get_a_percent_suffix(self):
+        labels = percent_labels({"grossMargin": "62", "netRetention": 115})
+        self.assertEqual(labels, {"grossMargin": "62%", "netRetention": "115%"})
+
+    def test_empty_and_unknown_fields_are_skipped(self):
+        self.assertEqual(percent_labels({"grossMargin": "", "revenueFY25": "10"}), {})
+
+
+class RevenueSeriesTest(unittest.TestCase):
+    def test_points_in_fiscal_order_with_cagr(self):
+        points, cagr = revenue_series({"revenueFY25": "121", "revenueFY24": "110", "revenueFY26P": ""})
+        self.assertEqual([(p.label, p.value) for p in points], [("FY24", 110.0), ("FY25", 121.0)])
+        self.assertEqual(cagr, 10)
+
+    def test_single_point_has_no_cagr(self):
+        points, cagr = revenue_series({"revenueFY25": "12"})
+        self.assertEqual(len(points), 1)
+        self.assertIsNone(cagr)
+
+
+class FilterRenderableSlidesTest(unittest.TestCase):
+    def test_guarded_slides_without_data_are_dropped(self):
+        slides = ["title", "financials", "case-study", "market-position", "thank-you"]
+        self.assertEqual(filter_renderable_slides(slides, {}), ["title", "thank-you"])
+
+    def test_guarded_slides_with_data_are_kept_in_order(self):
+        slides = ["title", "financials", "market-position", "thank-you"]
+        data = {"revenueFY25": "12", "marketSize": "$4B"}
+        self.assertEqual(filter_renderable_slides(slides, data), slides)
+
+    def test_appendix_case_studies_needs_more_than_two(self):
+        two = {"caseStudies": [{}, {}]}
+        three = {"caseStudies": [{}, {}, {}]}
+        self.assertEqual(filter_renderable_slides(["appendix-case-studies"], two), [])
+        self.assertEqual(filter_renderable_slides(["appendix-case-studies"], three), ["appendix-case-studies"])
+
+
+class XmlHelpersTest(unittest.TestCase):
+    """The prebuilt XML fragments must match what the python-pptx calls they replace"""
+
+    def setUp(self):
+        self.slide = blank_slide()
+
+    def assertSameShape(self, fragment, shape):
+        # Build the fragment with the id python-pptx gave the shape, then swap it in
+        _append_sp_xml(self.slide, fragment)
+        self.assertEqual(c14n(self.slide.shapes[-1]._element), c14n(shape._element))
+
+    def textbox(self, text, size, hex_color, bold=False, italic=False, align=None):
+        tb = self.slide.shapes.add_textbox(100, 200, 300, 400)
+        p = tb.text_frame.paragraphs[0]
+        p.text = text
+        p.font.size = size
+        if bold: p.font.bold = True
+        if italic: p.font.italic = True
+        p.font.color.rgb = RGBColor.from_string(hex_color)
+        if align: p.alignment = align
+        return tb
+
+    def test_solid_shape_matches_add_shape(self):
+        for line_hex in (None, "#D0D0D0"):
+            shape = self.slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 100, 200, 300, 400)
+            shape.fill.solid(); shape.fill.fore_color.rgb = RGBColor.from_string("1F4E79")
+            if line_hex: shape.line.color.rgb = RGBColor.from_string(line_hex[1:])
+            else: shape.line.fill.background()
+            self.assertSameShape(_solid_shape_xml(shape.shape_id, 100, 200, 300, 400, "#1f4e79", line_hex=line_hex), shape)
+
+    def test_oval_matches_add_shape(self):
+        shape = self.slide.shapes.add_shape(MSO_SHAPE.OVAL, 1, 2, 3, 4)
+        shape.fill.solid(); shape.fill.fore_color.rgb = RGBColor.from_string("2E86AB"); shape.line.fill.background()
+        self.assertSameShape(_solid_shape_xml(shape.shape_id, 1, 2, 3, 4, "#2E86AB", "ellipse", "Oval"), shape)
+
+    def test_textbox_matches_add_textbox(self):
+        cases = [
+            ("Revenue & EBITDA <FY25>", {}),
+            ("Bold", {"bold": True}),
+            ("Italic", {"italic": True}),
+            ("Both", {"bold": True, "italic": True}),
+            ("Right", {"align": PP_ALIGN.RIGHT}),
+            ("", {}),
+        ]
+        for text, style in cases:
+            with self.subTest(text=text):
+                tb = self.textbox(text, Pt(11), "333333", **style)
+                algn = {PP_ALIGN.RIGHT: "r"}.get(style.pop("align", None))
+                self.assertSameShape(_textbox_xml(tb.shape_id, 100, 200, 300, 400, text, Pt(11), "#333333",
+                                                  align=algn, **style), tb)
+
+    def test_frame_text_matches_text_frame_text(self):
+        text = "First line\nSecond\vwith break\n\nLast"
+        tb = self.slide.shapes.add_textbox(100, 200, 300, 400)
+        tb.text_frame.text = text
+        p = tb.text_frame.paragraphs[0]
+        p.font.size = Pt(10); p.font.bold = True; p.font.color.rgb = RGBColor.from_string("FFFFFF")
+        self.assertSameShape(_frame_text_xml(tb.shape_id, 100, 200, 300, 400, text, Pt(10), "#FFFFFF", bold=True), tb)
+
+    def test_control_characters_are_escaped_like_python_pptx(self):
+        tb = self.textbox("a\x01b\tc\x1fd", Pt(11), "000000")
+        self.assertSameShape(_textbox_xml(tb.shape_id, 100, 200, 300, 400, "a\x01b\tc\x1fd", Pt(11), "#000000"), tb)
+        self.assertIn("a_x0001_b", _paragraph_xml("a\x01b"))
+
+    def test_bold_and_italic_together(self):
+        xml = _paragraph_xml("x", Pt(12), "#000000", bold=True, italic=True)
+        self.assertIn('b="1" i="1"', xml)
+
+    def test_multi_paragraph_frame_parses(self):
+        paras = [_paragraph_xml(t, Pt(12), "#000000", space_after=Pt(6)) for t in ("a", "b")]
+        _append_sp_xml(self.slide, _text_frame_xml(self.slide.shapes._next_shape_id, 0, 0, 10, 10, paras))
+        self.assertEqual([p.text for p in self.slide.shapes[-1].text_frame.paragraphs], ["a", "b"])
+
+
+class AddMultilineTextTest(unittest.TestCase):
+    COLORS = get_theme_colors("modern-blue")
+
+    def frame(self, lines, size, pitch, **kw):
+        slide = blank_slide()
+        add_multiline_text(slide, self.COLORS, 0.82, 1.5, 3.8, lines, size, pitch, **kw)
+        shapes = list(slide.shapes)
+        self.assertEqual(len(shapes), 1)
+        return shapes[0]
+
+    def test_one_paragraph_per_line_in_one_frame(self):
+        tb = self.frame(["Alpha", "Beta", "Gamma"], Pt(12), 0.45)
+        self.assertEqual([p.text for p in tb.text_frame.paragraphs], ["Alpha", "Beta", "Gamma"])
+        self.assertEqual((tb.left, tb.top, tb.height), (emu(0.82), emu(1.5), emu(0.45 * 3)))
+
+    def test_paragraphs_keep_the_line_pitch(self):
+        # Single line height (1.2 x size) plus space_after must equal the old textbox pitch
+        for size, pitch in ((Pt(12), 0.45), (Pt(11), 0.3), (Pt(11), 0.5)):
+            tb = self.frame(["a", "b"], size, pitch)
+            for p in tb.text_frame.paragraphs:
+                self.assertAlmostEqual(size.pt * 1.2 + p.space_after.pt, pitch * 72, delta=0.01)  # spcPts is centipoints
+                self.assertEqual(p.font.size, size)
+
+    def test_pitch_below_line_height_clamps_spacing_to_zero(self):
+        tb = self.frame(["a", "b"], Pt(20), 0.2)
+        self.assertEqual(tb.text_frame.paragraphs[0].space_after, Pt(0))
+
+    def test_bold_applies_to_every_paragraph(self):
+        tb = self.frame(["a", "b"], Pt(11), 0.5, bold=True)
+        self.assertTrue(all(p.font.bold for p in tb.text_frame.paragraphs))
+
+    def test_no_lines_adds_nothing(self):
+        slide = blank_slide()
+        add_multiline_text(slide, self.COLORS, 0, 0, 1, [], Pt(12), 0.45)
+        self.assertEqual(len(slide.shapes), 0)
+
+
+@mock.patch.dict(os.environ, {"DISABLE_AI_LAYOUT": "true"})
+class GeneratePresentationTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch("builtins.print")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_snake_case_form_renders(self):
+        prs = generate_presentation({
+            "company_name": "Acme Analytics",
+            "document_type": "cim",
+            "revenueFY24": "10", "revenue_fy25": "12",
+            "service_lines": "Advisory|40\nImplementation|60",
+        })
+        self.assertIn("Acme Analytics", slide_texts(prs))
+        self.assertGreater(len(prs.slides), 3)
+
+    def test_control_characters_render(self):
+        prs = generate_presentation({"companyName": "Acme\x01 Analytics\x0c", "documentType": "cim"})
+        self.assertIn("Acme_x0001_ Analytics_x000C_", slide_texts(prs))
+
+    def test_chart_partnames_are_unique_and_sequential(self):
+        prs = generate_presentation({
+            "companyName": "Acme", "documentType": "cim",
+            "revenueFY24": "10", "revenueFY25": "12", "revenueFY26P": "15",
+            "serviceLines": "Advisory|40\nImplementation|35\nManaged|25",
+        })
+        buf = io.BytesIO()
+        prs.save(buf)
+        package = Presentation(buf).part.package
+        for pattern in (r"/ppt/charts/chart(\d+)\.xml", r"/ppt/embeddings/Microsoft_Excel_Sheet(\d+)\.xlsx"):
+            with self.subTest(pattern=pattern):
+                idxs = sorted(int(m.group(1)) for p in package.iter_parts() if (m := re.fullmatch(pattern, p.partname)))
+                self.assertGreaterEqual(len(idxs), 3)
+                self.assertEqual(idxs, list(range(1, len(idxs) + 1)))
+
+    def test_json_string_and_garbage_input(self):
+        self.assertGreater(len(generate_presentation('{"companyName": "Acme"}').slides), 0)
+        self.assertGreater(len(generate_presentation("not json").slides), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
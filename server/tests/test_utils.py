@@ -0,0 +1,44 @@
+"""
+Tests for the form-input helpers in utils.
+
+Run from server/: python -m unittest discover -s tests
+"""
+
+import unittest
+
+from utils import FIELD_ALIASES, normalize_form_keys
+
+
+class NormalizeFormKeysTest(unittest.TestCase):
+    def test_snake_case_alias_fills_missing_camel_key(self):
+        data = normalize_form_keys({"company_name": "Acme", "revenue_fy25": "12.5"})
+        self.assertEqual(data["companyName"], "Acme")
+        self.assertEqual(data["revenueFY25"], "12.5")
+
+    def test_camel_case_value_wins_over_alias(self):
+        data = normalize_form_keys({"companyName": "Acme", "company_name": "Other"})
+        self.assertEqual(data["companyName"], "Acme")
+
+    def test_empty_camel_case_value_is_filled_from_alias(self):
+        data = normalize_form_keys({"companyName": "", "company_name": "Acme"})
+        self.assertEqual(data["companyName"], "Acme")
+
+    def test_empty_alias_does_not_add_key(self):
+        self.assertNotIn("companyName", normalize_form_keys({"company_name": ""}))
+
+    def test_input_is_not_mutated(self):
+        raw = {"company_name": "Acme"}
+        normalize_form_keys(raw)
+        self.assertEqual(raw, {"company_name": "Acme"})
+
+    def test_aliases_keep_their_snake_case_keys(self):
+        data = normalize_form_keys({"primary_vertical": "healthcare"})
+        self.assertEqual(data["primary_vertical"], "healthcare")
+        self.assertEqual(data["primaryVertical"], "healthcare")
+
+    def test_every_alias_maps_to_a_distinct_camel_key(self):
+        self.assertEqual(len(set(FIELD_ALIASES.values())), len(FIELD_ALIASES))
+
+
+if __name__ == "__main__":
+    unittest.main()
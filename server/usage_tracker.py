@@ -9,6 +9,7 @@ Integrates with frontend Usage button.
 from typing import Dict, List, Optional
 from datetime import datetime
 import json
+import threading
 from pathlib import Path
 
 # ============================================================================
@@ -81,6 +82,8 @@ class UsageTracker:
         """
         self.storage_path = storage_path or Path("/tmp/anthropic_usage.json")
         self.stats = self._load_stats()
+        # Layout calls may be tracked from several worker threads at once
+        self._lock = threading.Lock()
     
     def _load_stats(self) -> Dict:
         """Load existing stats from disk or create new"""
@@ -153,48 +156,49 @@ class UsageTracker:
             "cost_usd": round(total_cost, 6)
         }
         
-        # Update global totals
-        self.stats["total_calls"] += 1
-        self.stats["total_input_tokens"] += input_tokens
-        self.stats["total_output_tokens"] += output_tokens
-        self.stats["total_cost_usd"] = round(self.stats["total_cost_usd"] + total_cost, 6)
+        with self._lock:
+            # Update global totals
+            self.stats["total_calls"] += 1
+            self.stats["total_input_tokens"] += input_tokens
+            self.stats["total_output_tokens"] += output_tokens
+            self.stats["total_cost_usd"] = round(self.stats["total_cost_usd"] + total_cost, 6)
         
-        # Update by-purpose breakdown
-        if purpose not in self.stats["by_purpose"]:
-            self.stats["by_purpose"][purpose] = {
-                "calls": 0,
-                "tokens": 0,
-                "cost": 0.0
-            }
+            # Update by-purpose breakdown
+            if purpose not in self.stats["by_purpose"]:
+                self.stats["by_purpose"][purpose] = {
+                    "calls": 0,
+                    "tokens": 0,
+                    "cost": 0.0
+                }
         
-        self.stats["by_purpose"][purpose]["calls"] += 1
-        self.stats["by_purpose"][purpose]["tokens"] += input_tokens + output_tokens
-        self.stats["by_purpose"][purpose]["cost"] = round(
-            self.stats["by_purpose"][purpose]["cost"] + total_cost, 6
-        )
+            self.stats["by_purpose"][purpose]["calls"] += 1
+            self.stats["by_purpose"][purpose]["tokens"] += input_tokens + output_tokens
+            self.stats["by_purpose"][purpose]["cost"] = round(
+                self.stats["by_purpose"][purpose]["cost"] + total_cost, 6
+            )
         
-        # Update by-model breakdown
-        model_name = pricing.get("name", model)
-        if model_name not in self.stats["by_model"]:
-            self.stats["by_model"][model_name] = {
-                "calls": 0,
-                "tokens": 0,
-                "cost": 0.0
-            }
+            # Update by-model breakdown
+            model_name = pricing.get("name", model)
+            if model_name not in self.stats["by_model"]:
+                self.stats["by_model"][model_name] = {
+                    "calls": 0,
+                    "tokens": 0,
+                    "cost": 0.0
+                }
         
-        self.stats["by_model"][model_name]["calls"] += 1
-        self.stats["by_model"][model_name]["tokens"] += input_tokens + output_tokens
-        self.stats["by_model"][model_name]["cost"] = round(
-            self.stats["by_model"][model_name]["cost"] + total_cost, 6
-        )
+            self.stats["by_model"][model_name]["calls"] += 1
+            self.stats["by_model"][model_name]["tokens"] += input_tokens + output_tokens
+            self.stats["by_model"][model_name]["cost"] = round(
+                self.stats["by_model"][model_name]["cost"] + total_cost, 6
+            )
         
-        # Add to call log (keep last 1000 calls only)
-        self.stats["calls"].append(call_record)
-        if len(self.stats["calls"]) > 1000:
-            self.stats["calls"] = self.stats["calls"][-1000:]
+            # Add to call log (keep last 1000 calls only)
+            self.stats["calls"].append(call_record)
+            if len(self.stats["calls"]) > 1000:
+                self.stats["calls"] = self.stats["calls"][-1000:]
         
-        # Save to disk
-        self._save_stats()
+            # Save to disk
+            self._save_stats()
         
         return call_record
     
@@ -9,8 +9,10 @@ Contains:
 """
 
 import re
+from functools import lru_cache
 from typing import List, Tuple, Optional
 from datetime import datetime
+from models import ChartPoint
 
 # ============================================================================
 # ABBREVIATIONS FOR TEXT CONDENSING
@@ -45,6 +47,9 @@ ABBREVIATIONS = {
     "artificial intelligence": "AI",
     "machine learning": "ML"
 }
+# All abbreviations as one alternation, so condensing is a single regex pass
+# (no abbreviation expands into another key, so the result matches applying them one by one)
+ABBREVIATION_PATTERN = re.compile(r'\b(?:' + '|'.join(map(re.escape, ABBREVIATIONS)) + r')\b', re.IGNORECASE)
 
 # ============================================================================
 # V8.0: TEXT OVERFLOW PREVENTION
@@ -160,18 +165,16 @@ def condense_text(text: str) -> str:
     if not text:
         return ""
     
-    result = text
-    for full, abbrev in ABBREVIATIONS.items():
-        pattern = re.compile(rf'\b{re.escape(full)}\b', re.IGNORECASE)
-        result = pattern.sub(abbrev, result)
+    result = ABBREVIATION_PATTERN.sub(lambda m: ABBREVIATIONS.get(m.group(0).casefold(), m.group(0)), text)
     
     # Normalize whitespace
     result = re.sub(r'\s+', ' ', result).strip()
     return result
 
 
+@lru_cache(maxsize=2048)
 def truncate_text(text: str, max_length: int, use_ellipsis: bool = True) -> str:
-    """Truncate text to max length, trying to break at word boundaries"""
+    """Truncate text to max length, trying to break at word boundaries (memoized: headers and labels repeat across a deck)"""
     if not text:
         return ""
     
@@ -206,8 +209,9 @@ def truncate_text(text: str, max_length: int, use_ellipsis: bool = True) -> str:
     return truncated.strip() + (".." if use_ellipsis else "")
 
 
+@lru_cache(maxsize=512)
 def truncate_description(text: str, max_length: int) -> str:
-    """Truncate description, preferring complete sentences"""
+    """Truncate description, preferring complete sentences (memoized like truncate_text)"""
     if not text:
         return ""
     
@@ -258,13 +262,23 @@ def format_date(date_str: str = None) -> str:
         return str(date_str)
 
 
+@lru_cache(maxsize=256)
+def _split_lines(text: str) -> Tuple[str, ...]:
+    """Stripped non-blank lines (memoized: fields such as leadershipTeam are parsed by several slides)"""
+    return tuple(line.strip() for line in text.split('\n') if line.strip())
+
+
+@lru_cache(maxsize=256)
+def _split_pipe_rows(text: str) -> Tuple[Tuple[str, ...], ...]:
+    return tuple(tuple(part.strip() for part in line.split('|')) for line in _split_lines(text))
+
+
 def parse_lines(text: str, max_lines: int = 10) -> List[str]:
     """Parse text into lines"""
     if not text:
         return []
     
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    return lines[:max_lines]
+    return list(_split_lines(text)[:max_lines])
 
 
 def parse_pipe_separated(text: str, max_items: int = 10) -> List[List[str]]:
@@ -272,14 +286,19 @@ def parse_pipe_separated(text: str, max_items: int = 10) -> List[List[str]]:
     if not text:
         return []
     
-    result = []
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    for line in lines[:max_items]:
-        parts = [part.strip() for part in line.split('|')]
-        result.append(parts)
-    
-    return result
+    return [list(parts) for parts in _split_pipe_rows(text)[:max_items]]
+
+
+def parse_services_with_pct(text: str, max_items: int = 10) -> Tuple[List[List[str]], List[ChartPoint]]:
+    """Parse 'Name|30%|Description' lines and their chart points in one pass"""
+    services, chart_data = [], []
+    for parts in parse_pipe_separated(text, max_items):
+        services.append(parts)
+        if len(parts) >= 2:
+            pct = extract_percentage(parts[1]) or 0
+            if pct > 0:
+                chart_data.append(ChartPoint(truncate_text(parts[0], 20), pct))
+    return services, chart_data
 
 
 def calculate_cagr(start_value: float, end_value: float, years: int) -> Optional[int]:
@@ -303,8 +322,9 @@ def adjusted_font(base_size: int, adjustment: int = 0) -> int:
 # COLOR UTILITIES
 # ============================================================================
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
-    """Convert hex color to RGB tuple"""
+    """Convert hex color to RGB tuple (memoized: themes reuse a handful of colours)"""
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
@@ -332,6 +352,58 @@ def darken_color(hex_color: str, factor: float = 0.3) -> str:
     return rgb_to_hex(r, g, b)
 
 
+# ============================================================================
+# FORM KEY NORMALIZATION
+# ============================================================================
+# snake_case aliases some API clients send, mapped to the camelCase form keys
+FIELD_ALIASES = {
+    "advisor_name": "advisorName",
+    "business_risks": "businessRisks",
+    "company_description": "companyDescription",
+    "company_name": "companyName",
+    "competitive_advantages": "competitiveAdvantages",
+    "competitor_landscape": "competitorLandscape",
+    "contact_email": "contactEmail",
+    "contact_phone": "contactPhone",
+    "document_type": "documentType",
+    "ebitda_margin_fy25": "ebitdaMarginFY25",
+    "generate_variants": "generateVariants",
+    "gross_margin": "grossMargin",
+    "growth_drivers": "growthDrivers",
+    "include_additional_case_studies": "includeAdditionalCaseStudies",
+    "leadership_team": "leadershipTeam",
+    "market_growth_rate": "marketGrowthRate",
+    "market_size": "marketSize",
+    "medium_term_goals": "mediumTermGoals",
+    "net_profit_margin": "netProfitMargin",
+    "net_retention": "netRetention",
+    "presentation_date": "presentationDate",
+    "primary_vertical": "primaryVertical",
+    "project_codename": "projectCodename",
+    "revenue_fy25": "revenueFY25",
+    "service_lines": "serviceLines",
+    "short_term_goals": "shortTermGoals",
+    "synergies_financial": "synergiesFinancial",
+    "synergies_strategic": "synergiesStrategic",
+    "target_buyer_type": "targetBuyerType",
+    "top_10_concentration": "top10Concentration",
+    "top_clients": "topClients"
+}
+
+
+def normalize_form_keys(data: dict) -> dict:
+    """
+    Return a copy of form data where every camelCase field is populated from
+    its snake_case alias when the camelCase value is empty, so renderers can
+    read a single key instead of chaining `get(camel) or get(snake)`.
+    """
+    normalized = dict(data)
+    for alias, key in FIELD_ALIASES.items():
+        if not normalized.get(key) and normalized.get(alias):
+            normalized[key] = normalized[alias]
+    return normalized
+
+
 # ============================================================================
 # DATA PREVIEW FOR AI
 # ============================================================================
@@ -680,13 +752,15 @@ def safe_int(value, default: int = 0) -> int:
         return default
 
 
+PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+
+
 def extract_percentage(text: str) -> Optional[float]:
     """Extract percentage value from text (e.g., '25%' -> 25.0)"""
     if not text:
         return None
     
-    import re
-    match = re.search(r'(\d+(?:\.\d+)?)\s*%', str(text))
+    match = PERCENT_RE.search(str(text))
     if match:
         return float(match.group(1))
     